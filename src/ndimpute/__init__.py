@@ -1,3 +1,6 @@
 from .api import impute
+from ._interval import bootstrap_interval_ros
+from ._ros_left import plotting_positions
+from ._estimator import CensoredImputer
 
-__all__ = ["impute"]
+__all__ = ["impute", "bootstrap_interval_ros", "plotting_positions", "CensoredImputer"]
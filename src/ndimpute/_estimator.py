@@ -0,0 +1,256 @@
+import inspect
+import numpy as np
+from ._ros_left import km_curve, limit_positions, plotting_positions, ros_left_fit, ros_impute_censored, _KM_POSITIONS
+from ._interval import interval_npmle, interval_ros_fit, interval_ros_impute, TURNBULL_OPTIONS
+from ._ros_mixed import mixed_ros_fit, mixed_to_intervals, _impute_ros_mixed_legacy
+from ._parametric import impute_mixed_parametric
+
+class CensoredImputer:
+    """
+    Imputer with a fit / transform interface, following the scikit-learn
+    estimator conventions (get_params / set_params, fitted attributes with a
+    trailing underscore, picklable) without depending on scikit-learn.
+
+    `fit` estimates the model once; `transform` imputes any batch with it, so
+    repeated imputations (bootstrap draws, new batches, pipeline refits) do
+    not recompute an identical fit. `fit_transform` on a dataset gives the
+    same values as `impute` with the same settings.
+
+    Args:
+        method (str): 'ros' or 'parametric'.
+        dist (str): 'lognormal' or 'normal' ('weibull' too for parametric).
+        censoring_type (str): 'left', 'right', 'mixed' or 'interval'.
+        impute_type (str, optional): 'stochastic' or 'mean'. Defaults to
+            'stochastic' for ROS and 'mean' for parametric, as in `impute`.
+        plotting_position (str): Plotting positions of left / right ROS; only
+            the Kaplan-Meier (Hirsch-Stedinger) positions can be reused for new
+            data.
+        random_state (int, optional): Seed for stochastic imputation.
+        turnbull_kwargs (dict, optional): Turnbull estimator options for
+            interval / mixed ROS (accelerator, solver, prune_tol, ...).
+
+    Fitted attributes:
+        ROS (left / right): slope_, intercept_, r_squared_, positions_
+            (pp_unc, pp_limits of the training data) and km_curve_ (knots,
+            below), the Kaplan-Meier curve used to place new censoring limits.
+            For right censoring the ROS line and curve are those of the
+            reversed problem, see `impute_ros_right`.
+        ROS (mixed / interval): slope_ (sigma), intercept_ (mu), r_squared_
+            and turnbull_ (intervals, probs). Mixed ROS falls back to the
+            legacy sequential heuristic with a warning when the interval fit
+            fails, as `impute` does; fallback_ is then True, the fitted
+            values are NaN and `transform` runs the heuristic on each batch.
+        Parametric: params_, the maximum likelihood parameters as returned
+            by `impute_mixed_parametric(..., return_params=True)`.
+        n_samples_fit_: Number of rows used by the fit.
+
+    Example:
+        >>> imputer = CensoredImputer(dist='lognormal', censoring_type='left')
+        >>> imputed = imputer.fit(values, status).transform(new_values, new_status)
+    """
+
+    def __init__(self, method='ros', dist='lognormal', censoring_type='left', impute_type=None, plotting_position='kaplan-meier', random_state=None, turnbull_kwargs=None):
+        self.method = method
+        self.dist = dist
+        self.censoring_type = censoring_type
+        self.impute_type = impute_type
+        self.plotting_position = plotting_position
+        self.random_state = random_state
+        self.turnbull_kwargs = turnbull_kwargs
+
+    def get_params(self, deep=True):
+        """
+        Returns the constructor parameters of the imputer.
+
+        Args:
+            deep (bool): Accepted for scikit-learn compatibility (no nested
+                estimators).
+
+        Returns:
+            dict: Parameter names mapped to their values.
+        """
+        names = [p for p in inspect.signature(type(self).__init__).parameters if p != 'self']
+        return {name: getattr(self, name) for name in names}
+
+    def set_params(self, **params):
+        """
+        Sets constructor parameters. A refit is needed for them to take effect.
+
+        Returns:
+            CensoredImputer: self
+        """
+        valid = self.get_params()
+        for name, value in params.items():
+            if name not in valid:
+                raise ValueError(f"Invalid parameter '{name}' for {type(self).__name__}. Valid parameters: {sorted(valid)}.")
+            setattr(self, name, value)
+        return self
+
+    def __repr__(self):
+        args = ', '.join(f"{k}={v!r}" for k, v in self.get_params().items())
+        return f"{type(self).__name__}({args})"
+
+    def fit(self, values, status=None):
+        """
+        Fits the imputation model.
+
+        Args:
+            values (array-like): Data values, or an (N, 2) array of bounds for
+                interval censoring.
+            status (array-like, optional): Censoring indicator as in `impute`
+                (bool for left / right, -1 / 0 / 1 for mixed; unused for
+                interval).
+
+        Returns:
+            CensoredImputer: self
+        """
+        self._validate()
+        data = self._prepare(values, status)
+
+        if self.method == 'parametric':
+            values, status = data
+            _, self.params_ = impute_mixed_parametric(values, status, dist=self.dist, impute_type=self._impute_type(), random_state=self.random_state, return_params=True)
+
+        elif self.censoring_type in ('left', 'right'):
+            values, is_censored = data
+            positions = plotting_positions(values, is_censored, censoring=self.censoring_type)
+            self.slope_, self.intercept_, self.r_squared_ = ros_left_fit(self._reverse(values), is_censored, dist=self.dist, positions=positions)
+            self.positions_ = positions
+            self.km_curve_ = km_curve(self._flip(values), is_censored)
+
+        elif self.censoring_type == 'mixed':
+            values, status = data
+            npmle, (self.slope_, self.intercept_, self.r_squared_) = mixed_ros_fit(values, status, self.dist, **(self.turnbull_kwargs or {}))
+            self.fallback_ = npmle is None
+            self.turnbull_ = None if self.fallback_ else npmle[:2]
+
+        else:
+            left, right = data
+            intervals, probs, _ = interval_npmle(left, right, **(self.turnbull_kwargs or {}))
+            self.slope_, self.intercept_, self.r_squared_ = interval_ros_fit(intervals, probs, self.dist)
+            self.turnbull_ = (intervals, probs)
+
+        self.n_samples_fit_ = len(data[0])
+        return self
+
+    def transform(self, values, status=None):
+        """
+        Imputes censored values with the fitted model. Observed values are
+        returned unchanged.
+
+        Args:
+            values (array-like): Data values, or an (N, 2) array of bounds for
+                interval censoring.
+            status (array-like, optional): Censoring indicator, see `fit`.
+
+        Returns:
+            array: Imputed values.
+        """
+        if not hasattr(self, 'n_samples_fit_'):
+            raise ValueError(f"This {type(self).__name__} instance is not fitted yet. Call 'fit' first.")
+        data = self._prepare(values, status)
+        impute_type = self._impute_type()
+
+        if self.method == 'parametric':
+            values, status = data
+            return impute_mixed_parametric(values, status, dist=self.dist, impute_type=impute_type, random_state=self.random_state, params=self.params_)
+
+        if self.censoring_type in ('left', 'right'):
+            values, is_censored = data
+            reversed_values = self._reverse(values)
+
+            pp_limits = limit_positions(self.km_curve_, self._flip(values)[is_censored], self.n_samples_fit_)
+            result = reversed_values.copy()
+            result[is_censored] = ros_impute_censored(reversed_values[is_censored], pp_limits, self.slope_, self.intercept_, self.dist, impute_type, self.random_state)
+            return self._reverse(result)
+
+        if self.censoring_type == 'mixed':
+            values, status = data
+            if self.fallback_:
+                return _impute_ros_mixed_legacy(values, status, dist=self.dist, plotting_position=self.plotting_position, impute_type=impute_type, random_state=self.random_state)
+            left, right = mixed_to_intervals(values, status, self.dist)
+        else:
+            left, right = data
+        return interval_ros_impute(left, right, self.slope_, self.intercept_, self.dist, impute_type, self.random_state)
+
+    def fit_transform(self, values, status=None):
+        """
+        Fits the model and imputes the same data.
+
+        Returns:
+            array: Imputed values.
+        """
+        return self.fit(values, status).transform(values, status)
+
+    def _validate(self):
+        if self.censoring_type not in ('left', 'right', 'mixed', 'interval'):
+            raise ValueError("censoring_type must be 'left', 'right', 'mixed', or 'interval'")
+        if self.method == 'parametric':
+            # Same support as `impute`
+            if self.censoring_type == 'interval':
+                raise NotImplementedError("Method 'parametric' not implemented for interval censoring.")
+            if self.censoring_type == 'left':
+                raise NotImplementedError("Method 'parametric' not implemented for left censoring.")
+        elif self.method == 'ros':
+            if self.dist not in ('lognormal', 'normal'):
+                raise ValueError(f"Unknown distribution '{self.dist}' for ROS. Supported: 'normal', 'lognormal'.")
+            if self.censoring_type in ('left', 'right') and self.plotting_position not in _KM_POSITIONS:
+                raise ValueError(f"plotting_position='{self.plotting_position}' cannot be reused on new data; use 'kaplan-meier'.")
+            unknown = set(self.turnbull_kwargs or {}) - set(TURNBULL_OPTIONS)
+            if unknown:
+                raise ValueError(f"Unknown Turnbull options: {sorted(unknown)}.")
+        else:
+            raise ValueError(f"Unknown method '{self.method}'. Supported: 'ros', 'parametric'.")
+
+    def _impute_type(self):
+        if self.impute_type is not None:
+            return self.impute_type
+        return 'mean' if self.method == 'parametric' else 'stochastic'
+
+    def _prepare(self, values, status):
+        """
+        Converts the input to (values, status) with -1 / 0 / 1 status for
+        mixed data and the parametric method, (values, is_censored) for
+        left / right ROS and (left, right) bounds for interval ROS.
+        """
+        if self.censoring_type == 'interval':
+            bounds = np.asarray(values, dtype=float)
+            if bounds.ndim != 2 or bounds.shape[1] != 2:
+                raise ValueError("For censoring_type='interval', values must be (N, 2) array of bounds.")
+            return bounds[:, 0], bounds[:, 1]
+
+        values = np.asarray(values, dtype=float)
+        if status is None:
+            raise ValueError("Status argument is required for left/right/mixed censoring.")
+
+        if self.censoring_type == 'mixed':
+            # Boolean status means left censoring, as in `impute`
+            status = np.asarray(status)
+            if status.dtype == bool:
+                status = np.where(status, -1, 0)
+            return values, status.astype(int)
+
+        is_censored = np.asarray(status, dtype=bool)
+        if self.method == 'parametric':
+            # Right censoring (left is rejected by `_validate`)
+            return values, np.where(is_censored, 1, 0)
+        if self.dist == 'lognormal' and (values <= 0).any():
+            raise ValueError("Values must be positive for lognormal distribution.")
+        return values, is_censored
+
+    def _reverse(self, values):
+        """
+        Maps right-censored data to the left-censored problem solved by
+        `impute_ros_right` (1 / y for lognormal, -y for normal); the mapping
+        is its own inverse. Left-censored data is returned as is.
+        """
+        if self.censoring_type == 'left':
+            return values
+        if self.dist == 'lognormal':
+            return 1.0 / values
+        return -values
+
+    def _flip(self, values):
+        # Order-preserving reversal used for the Kaplan-Meier curve; matches
+        # `plotting_positions(..., censoring='right')`.
+        return values if self.censoring_type == 'left' else -values
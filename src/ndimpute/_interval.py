@@ -1,8 +1,13 @@
+import warnings
 import numpy as np
+import pandas as pd
 from scipy.stats import norm, linregress
-from ._turnbull import turnbull_em, predict_turnbull
+from ._turnbull import turnbull_em, turnbull_em_grouped, turnbull_em_batch, predict_turnbull, collapse_intervals
 
-def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic', random_state=None, return_fit=False):
+# Keyword arguments of impute_interval_ros that configure the Turnbull estimator
+TURNBULL_OPTIONS = ('accelerator', 'solver', 'prune_tol', 'warm_start', 'coarsen', 'n_bins')
+
+def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic', random_state=None, return_fit=False, accelerator=None, solver='em', prune_tol=None, warm_start=None, coarsen=None, n_bins=256, return_diagnostics=False, npmle=None):
     """
     Imputes interval-censored data using ROS with plotting positions derived
     from the Turnbull Estimator.
@@ -17,6 +22,27 @@ def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic',
               This preserves variance for large datasets.
         random_state (int, np.random.Generator, optional): Seed or generator for stochastic imputation.
         return_fit (bool): If True, returns (imputed_values, r_squared).
+        accelerator (str, optional): EM acceleration for the Turnbull estimator
+            (None, 'squarem' or 'aitken'; 'squarem' is recommended). See `turnbull_em`.
+        solver (str): NPMLE algorithm for the Turnbull estimator ('em' or 'em-icm').
+        prune_tol (float, optional): Active-set pruning threshold for the
+            Turnbull estimator. See `turnbull_em`.
+        warm_start (tuple or object, optional): Previous Turnbull NPMLE used as
+            the starting point. See `turnbull_em`.
+        coarsen (str, float or array, optional): Snaps the Turnbull endpoints
+            onto a grid ('quantile', a resolution or explicit grid points) for
+            an approximate, faster NPMLE. Imputation still uses the original
+            bounds. See `coarsen_intervals`.
+        n_bins (int): Number of quantile bins when coarsen='quantile'.
+        return_diagnostics (bool): If True, the Turnbull diagnostics dict (see
+            `turnbull_em`) is appended to the result.
+        npmle (tuple, optional): Precomputed `interval_npmle(left, right)`, e.g.
+            shared across candidate distributions. The Turnbull options are
+            ignored when it is given.
+
+    Returns:
+        array or tuple: Imputed values, followed by r_squared if return_fit=True
+        and by the diagnostics dict if return_diagnostics=True.
     """
     left = np.array(left)
     right = np.array(right)
@@ -24,13 +50,93 @@ def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic',
     if dist not in ['normal', 'lognormal']:
         raise ValueError(f"Unknown distribution '{dist}'. Supported: 'normal', 'lognormal'.")
 
-    # 1. Turnbull Estimator
-    intervals, probs = turnbull_em(left, right)
+    # 1. Turnbull Estimator (on distinct rows, weighted by multiplicity)
+    if npmle is None:
+        npmle = interval_npmle(left, right, accelerator=accelerator, solver=solver, prune_tol=prune_tol, warm_start=warm_start, coarsen=coarsen, n_bins=n_bins)
+    intervals, probs, diagnostics = npmle
+
+    # 2. Plotting positions and regression
+    slope, intercept, r_squared = interval_ros_fit(intervals, probs, dist)
+
+    # 3. Impute
+    imputed = interval_ros_impute(left, right, slope, intercept, dist, impute_type, random_state)
+
+    result = (imputed,)
+    if return_fit:
+        result += (r_squared,)
+    if return_diagnostics:
+        result += (diagnostics,)
+    return result if len(result) > 1 else imputed
+
+def interval_ros_impute(left, right, slope, intercept, dist='lognormal', impute_type='stochastic', random_state=None):
+    """
+    Imputes interval-censored rows from a fitted interval ROS line.
+
+    Args:
+        left (array): Lower bounds.
+        right (array): Upper bounds.
+        slope (float): Regression slope (sigma of the model).
+        intercept (float): Regression intercept (mu of the model).
+        dist (str): 'lognormal' or 'normal'.
+        impute_type (str): 'stochastic' (default) or 'mean'.
+        random_state (int, np.random.Generator, optional): Seed or generator for stochastic imputation.
+
+    Returns:
+        array: Imputed values, exact rows (left == right) kept as observed.
+    """
+    # Rows with identical bounds share the same conditional mean, so 'mean'
+    # imputation is done once per distinct row and expanded back.
+    if impute_type == 'stochastic':
+        rng = np.random.default_rng(random_state)
+        # Use uniform noise U[0, 1] to sample from truncated CDF
+        u_noise = rng.uniform(0, 1, size=len(left))
+        imputed = _impute_rows(left, right, intercept, slope, dist, impute_type, u_noise)
+    else:
+        left_u, right_u, _, inverse = collapse_intervals(left, right)
+        imputed = _impute_rows(left_u, right_u, intercept, slope, dist, impute_type)[inverse]
+
+    # Explicitly preserve exact observations to avoid floating point drift
+    # where left == right
+    mask_exact = (left == right)
+    imputed[mask_exact] = left[mask_exact]
+    return imputed
+
+def interval_npmle(left, right, **turnbull_kwargs):
+    """
+    Turnbull NPMLE used by Interval ROS, fitted on the distinct rows weighted
+    by multiplicity. It does not depend on the distribution, so one result
+    can serve every candidate of dist='auto'.
+
+    Args:
+        left (array): Lower bounds.
+        right (array): Upper bounds.
+        **turnbull_kwargs: Options passed to `turnbull_em` (see TURNBULL_OPTIONS).
+
+    Returns:
+        tuple: (intervals, probs, diagnostics)
+    """
+    left_u, right_u, counts, _ = collapse_intervals(left, right)
+    intervals, probs, diagnostics = turnbull_em(left_u, right_u, weights=counts, return_diagnostics=True, **turnbull_kwargs)
+    # Report the caller's rows, not the collapsed ones.
+    diagnostics['n_rows'] = len(left)
+    return intervals, probs, diagnostics
+
+def interval_ros_fit(intervals, probs, dist='lognormal'):
+    """
+    Fits the Interval ROS regression line to Turnbull plotting positions.
 
+    Args:
+        intervals (array): (M, 2) Turnbull equivalence intervals.
+        probs (array): (M,) probability mass of each interval.
+        dist (str): 'lognormal' or 'normal'.
+
+    Returns:
+        tuple: (slope, intercept, r_squared), in the order of `ros_left_fit`.
+    """
     if len(probs) == 0:
         raise ValueError("Turnbull estimator failed to find valid intervals.")
 
-    # 2. Calculate Plotting Positions
+    # Plotting Positions
     # Fit regression to Turnbull CDF points
     if dist == 'lognormal':
         # Geometric mean for lognormal midpoint
@@ -104,58 +210,293 @@ def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic',
 
     intercept = w_mean_y - slope * w_mean_x
 
-    # 3. Impute
-    mu_model = intercept
-    sigma_model = slope
+    return slope, intercept, r_squared
+
+def impute_interval_ros_grouped(left, right, groups, dist='lognormal', impute_type='stochastic', random_state=None, return_fit=False, max_iter=1000, tol=1e-5):
+    """
+    Imputes interval-censored data with a separate Interval ROS fit per group,
+    solving all groups in one vectorized pass.
+
+    The Turnbull NPMLE of every group is computed by `turnbull_em_grouped`;
+    plotting positions and weighted regressions are then evaluated with
+    segmented sums, so the cost does not grow with per-group Python overhead.
+    Groups whose fit fails (e.g. fewer than two weighted points) are imputed
+    as NaN with a warning.
+
+    Args:
+        left (array): Lower bounds.
+        right (array): Upper bounds.
+        groups (array): Group label of each row.
+        dist (str): 'lognormal' or 'normal'.
+        impute_type (str): 'stochastic' (default) or 'mean'.
+        random_state (int, np.random.Generator, optional): Seed or generator for stochastic imputation.
+        return_fit (bool): If True, returns (imputed_values, fits, positions).
+            - fits: DataFrame indexed by group with 'intercept', 'slope',
+              'r_squared', 'n' and 'n_intervals'.
+            - positions: DataFrame of Turnbull intervals per group with 'group',
+              'start', 'end', 'prob' and 'plotting_position'.
+        max_iter (int): Maximum Turnbull EM iterations per group.
+        tol (float): Turnbull EM convergence tolerance.
+    """
+    left = np.array(left, dtype=float)
+    right = np.array(right, dtype=float)
+    groups = np.asarray(groups)
 
-    imputed = np.zeros_like(left, dtype=float)
+    if dist not in ['normal', 'lognormal']:
+        raise ValueError(f"Unknown distribution '{dist}'. Supported: 'normal', 'lognormal'.")
 
-    # Pre-generate random noise for stochastic
+    # 1. Turnbull Estimator for every group
+    intervals, probs, col_group, group_ids = turnbull_em_grouped(left, right, groups, max_iter=max_iter, tol=tol)
+    n_groups = len(group_ids)
+    row_group = np.searchsorted(group_ids, groups)
+
+    # 2. Plotting positions from the per-group cumulative probabilities
+    cum = np.cumsum(probs)
+    group_offset = np.concatenate(([0.0], cum))[np.searchsorted(col_group, np.arange(n_groups))]
+    cdf_vals = cum - group_offset[col_group]
+    pp_turnbull = np.clip(cdf_vals - (probs / 2.0), 1e-9, 1 - 1e-9)
+    z_turnbull = norm.ppf(pp_turnbull)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if dist == 'lognormal':
+            mids = np.sqrt(intervals[:, 0] * intervals[:, 1])
+            valid = mids > 0
+            y_all = np.log(np.where(valid, mids, 1.0))
+        else:
+            mids = np.mean(intervals, axis=1)
+            valid = np.isfinite(mids)
+            y_all = np.where(valid, mids, 0.0)
+
+    # Weighted OLS per group via segmented sums
+    w = np.where(valid & (probs > 1e-9), probs, 0.0)
+    n_points = np.bincount(col_group, weights=(w > 0).astype(float), minlength=n_groups)
+    sum_w = np.bincount(col_group, weights=w, minlength=n_groups)
+    safe_w = np.where(sum_w > 0, sum_w, 1.0)
+    mean_x = np.bincount(col_group, weights=w * z_turnbull, minlength=n_groups) / safe_w
+    mean_y = np.bincount(col_group, weights=w * y_all, minlength=n_groups) / safe_w
+
+    dx = z_turnbull - mean_x[col_group]
+    dy = y_all - mean_y[col_group]
+    s_zy = np.bincount(col_group, weights=w * dx * dy, minlength=n_groups)
+    s_zz = np.bincount(col_group, weights=w * dx**2, minlength=n_groups)
+    s_yy = np.bincount(col_group, weights=w * dy**2, minlength=n_groups)
+
+    degenerate = (s_zz < 1e-12) | (s_yy < 1e-12)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(degenerate, 0.0, s_zy / s_zz)
+        r_squared = np.where(degenerate, 0.0, s_zy**2 / (s_zz * s_yy))
+    intercept = mean_y - slope * mean_x
+
+    failed = n_points < 2
+    if np.any(failed):
+        warnings.warn(f"Interval ROS failed for {np.sum(failed)} group(s) with insufficient "
+                      f"Turnbull intervals to fit regression; their values are set to NaN.")
+        slope[failed] = np.nan
+        intercept[failed] = np.nan
+        r_squared[failed] = np.nan
+
+    # 3. Impute with each row's group fit
     if impute_type == 'stochastic':
         rng = np.random.default_rng(random_state)
-        # Use uniform noise U[0, 1] to sample from truncated CDF
         u_noise = rng.uniform(0, 1, size=len(left))
+        imputed = _impute_rows(left, right, intercept[row_group], slope[row_group], dist, impute_type, u_noise)
+    else:
+        rows, inverse = np.unique(np.column_stack((row_group, left, right)), axis=0, return_inverse=True)
+        row_g = rows[:, 0].astype(int)
+        imputed = _impute_rows(rows[:, 1], rows[:, 2], intercept[row_g], slope[row_g], dist, impute_type)[inverse.ravel()]
 
-    for i in range(len(left)):
-        l_i, r_i = left[i], right[i]
+    failed_rows = failed[row_group]
+    imputed[failed_rows] = np.nan
 
-        # Transform bounds to Z-space
-        # If sigma is 0, we can't divide.
-        if abs(sigma_model) < 1e-12:
-             if dist == 'lognormal':
-                imputed[i] = np.exp(mu_model)
-             else:
-                imputed[i] = mu_model
-             continue
+    mask_exact = (left == right)
+    imputed[mask_exact] = left[mask_exact]
+
+    if return_fit:
+        fits = pd.DataFrame({
+            'intercept': intercept,
+            'slope': slope,
+            'r_squared': r_squared,
+            'n': np.bincount(row_group, minlength=n_groups),
+            'n_intervals': np.bincount(col_group, minlength=n_groups)
+        }, index=pd.Index(group_ids, name='group'))
+
+        positions = pd.DataFrame({
+            'group': group_ids[col_group],
+            'start': intervals[:, 0],
+            'end': intervals[:, 1],
+            'prob': probs,
+            'plotting_position': pp_turnbull
+        })
+        return imputed, fits, positions
+    return imputed
+
+def bootstrap_interval_ros(left, right, n_boot=200, dist='lognormal', ci=0.95, random_state=None, max_iter=1000, tol=1e-5, return_samples=False):
+    """
+    Bootstrap percentile intervals for the Interval ROS fit.
+
+    Resamples are represented as multinomial counts over the distinct rows,
+    so the equivalence intervals are built once and all Turnbull problems
+    are solved in one batched EM (`turnbull_em_batch`). The regression line
+    of every resample is fitted with vectorized weighted least squares.
+
+    Args:
+        left (array): Lower bounds.
+        right (array): Upper bounds.
+        n_boot (int): Number of bootstrap resamples.
+        dist (str): 'lognormal' or 'normal'.
+        ci (float): Confidence level of the percentile intervals.
+        random_state (int, np.random.Generator, optional): Seed or generator for resampling.
+        max_iter (int): Maximum Turnbull EM iterations.
+        tol (float): Turnbull EM convergence tolerance.
+        return_samples (bool): If True, returns (summary, samples).
+
+    Returns:
+        pd.DataFrame: Indexed by statistic ('intercept', 'slope', 'mean',
+        'median', 'std') with columns 'estimate' (fit on the original data),
+        'lower' and 'upper'. The summary statistics are those of the fitted
+        distribution. If return_samples=True, also returns the (n_boot, 5)
+        DataFrame of bootstrap replicates.
+    """
+    left = np.array(left, dtype=float)
+    right = np.array(right, dtype=float)
+
+    if dist not in ['normal', 'lognormal']:
+        raise ValueError(f"Unknown distribution '{dist}'. Supported: 'normal', 'lognormal'.")
+    if not 0 < ci < 1:
+        raise ValueError("ci must be between 0 and 1.")
 
+    rng = np.random.default_rng(random_state)
+    n = len(left)
+    left_u, right_u, counts, _ = collapse_intervals(left, right)
+    resamples = rng.multinomial(n, counts / n, size=n_boot)
+
+    # Row 0 is the original data, so the estimate uses the same solver.
+    weights = np.vstack([counts, resamples])
+    intervals, probs, _ = turnbull_em_batch(left_u, right_u, weights, max_iter=max_iter, tol=tol)
+
+    if intervals.shape[0] < 2:
+        raise ValueError("Turnbull yielded insufficient intervals (points) to fit regression.")
+
+    # Plotting positions and weighted OLS per resample
+    pp_turnbull = np.clip(np.cumsum(probs, axis=1) - probs / 2.0, 1e-9, 1 - 1e-9)
+    z = norm.ppf(pp_turnbull)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
         if dist == 'lognormal':
-            with np.errstate(divide='ignore'):
-                z_l = (np.log(l_i) - mu_model) / sigma_model if l_i > 0 else -np.inf
-                z_r = (np.log(r_i) - mu_model) / sigma_model if not np.isinf(r_i) else np.inf
+            mids = np.sqrt(intervals[:, 0] * intervals[:, 1])
+            valid = mids > 0
+            y = np.log(np.where(valid, mids, 1.0))
         else:
-            z_l = (l_i - mu_model) / sigma_model
-            z_r = (r_i - mu_model) / sigma_model if not np.isinf(r_i) else np.inf
+            mids = np.mean(intervals, axis=1)
+            valid = np.isfinite(mids)
+            y = np.where(valid, mids, 0.0)
+
+    w = np.where(valid & (probs > 1e-9), probs, 0.0)
+    n_points = np.sum(w > 0, axis=1)
+    sum_w = np.sum(w, axis=1)
+    safe_w = np.where(sum_w > 0, sum_w, 1.0)
+    mean_x = np.sum(w * z, axis=1) / safe_w
+    mean_y = np.sum(w * y, axis=1) / safe_w
+
+    dx = z - mean_x[:, None]
+    dy = y - mean_y[:, None]
+    s_zy = np.sum(w * dx * dy, axis=1)
+    s_zz = np.sum(w * dx**2, axis=1)
+    s_yy = np.sum(w * dy**2, axis=1)
+
+    degenerate = (s_zz < 1e-12) | (s_yy < 1e-12)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(degenerate, 0.0, s_zy / s_zz)
+    intercept = mean_y - slope * mean_x
+
+    failed = n_points < 2
+    slope[failed] = np.nan
+    intercept[failed] = np.nan
+    if failed[0]:
+        raise ValueError("Turnbull yielded insufficient intervals (points) to fit regression.")
+    if np.any(failed[1:]):
+        warnings.warn(f"Interval ROS failed for {np.sum(failed[1:])} bootstrap resample(s); "
+                      f"they are excluded from the percentile intervals.")
+
+    if dist == 'lognormal':
+        mean = np.exp(intercept + slope**2 / 2)
+        median = np.exp(intercept)
+        std = mean * np.sqrt(np.expm1(slope**2))
+    else:
+        mean = intercept
+        median = intercept
+        std = np.abs(slope)
+
+    stats = pd.DataFrame({
+        'intercept': intercept,
+        'slope': slope,
+        'mean': mean,
+        'median': median,
+        'std': std
+    })
+    samples = stats.iloc[1:].reset_index(drop=True)
+
+    alpha = (1 - ci) / 2
+    summary = pd.DataFrame({
+        'estimate': stats.iloc[0],
+        'lower': samples.quantile(alpha),
+        'upper': samples.quantile(1 - alpha)
+    })
+    summary.index.name = 'statistic'
+
+    if return_samples:
+        return summary, samples
+    return summary
+
+def _impute_rows(left, right, mu_model, sigma_model, dist, impute_type, u_noise=None):
+    """
+    Imputes each row from the fitted ROS line, truncated to its bounds.
+
+    Args:
+        left (array): Lower bounds.
+        right (array): Upper bounds.
+        mu_model (float or array): Regression intercept (location), scalar or per row.
+        sigma_model (float or array): Regression slope (scale), scalar or per row.
+        dist (str): 'lognormal' or 'normal'.
+        impute_type (str): 'mean' or 'stochastic'.
+        u_noise (array, optional): U[0, 1] draws per row (stochastic only).
+
+    Returns:
+        array: Imputed values.
+    """
+    left = np.asarray(left, dtype=float)
+    right = np.asarray(right, dtype=float)
+    mu = np.broadcast_to(np.asarray(mu_model, dtype=float), left.shape)
+    sigma = np.broadcast_to(np.asarray(sigma_model, dtype=float), left.shape)
+
+    # Every branch is evaluated on all rows and selected with masks, so
+    # warnings from the rows a branch does not apply to are silenced.
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Transform bounds to Z-space
+        if dist == 'lognormal':
+            z_l = np.where(left > 0, (np.log(left) - mu) / sigma, -np.inf)
+            z_r = np.where(np.isinf(right), np.inf, (np.log(right) - mu) / sigma)
+        else:
+            z_l = (left - mu) / sigma
+            z_r = np.where(np.isinf(right), np.inf, (right - mu) / sigma)
 
         # Ensure z_l < z_r
-        if sigma_model < 0:
-             z_l, z_r = z_r, z_l
+        flip = sigma < 0
+        z_l, z_r = np.where(flip, z_r, z_l), np.where(flip, z_l, z_r)
 
         # Calculate Z value
         Phi_a = norm.cdf(z_l)
-        Phi_b = norm.cdf(z_r) if not np.isinf(z_r) else 1.0
+        Phi_b = np.where(np.isinf(z_r), 1.0, norm.cdf(z_r))
 
         if impute_type == 'mean':
             phi_a = norm.pdf(z_l)
-            phi_b = norm.pdf(z_r) if not np.isinf(z_r) else 0.0
+            phi_b = np.where(np.isinf(z_r), 0.0, norm.pdf(z_r))
             denom = Phi_b - Phi_a
 
-            if denom < 1e-9:
-                # Interval is extremely far in tail or tiny (e.g. singleton).
-                e_z = (z_l + z_r) / 2 if not np.isinf(z_r) and not np.isinf(z_l) else z_l
-            else:
-                e_z = (phi_a - phi_b) / denom
-
-            z_final = e_z
+            # Interval is extremely far in tail or tiny (e.g. singleton).
+            both_finite = ~np.isinf(z_l) & ~np.isinf(z_r)
+            e_tiny = np.where(both_finite, (z_l + z_r) / 2, z_l)
+            z_final = np.where(denom < 1e-9, e_tiny, (phi_a - phi_b) / denom)
 
         else: # stochastic
             # Sample Z from Truncated Normal
@@ -165,33 +506,22 @@ def impute_interval_ros(left, right, dist='lognormal', impute_type='stochastic',
             Phi_b = np.clip(Phi_b, 1e-15, 1 - 1e-15)
 
             # If interval is tiny (singleton), Phi_a ~ Phi_b.
-            if (Phi_b - Phi_a) < 1e-9:
-                 z_final = z_l
-            else:
-                # Map U[0,1] to U[Phi_a, Phi_b]
-                u_mapped = Phi_a + u_noise[i] * (Phi_b - Phi_a)
-                z_final = norm.ppf(u_mapped)
+            # Otherwise map U[0,1] to U[Phi_a, Phi_b]
+            tiny = (Phi_b - Phi_a) < 1e-9
+            u_mapped = Phi_a + u_noise * (Phi_b - Phi_a)
+            z_final = np.where(tiny, z_l, norm.ppf(np.where(tiny, 0.5, u_mapped)))
 
         # Back transform
-        pred_val = mu_model + sigma_model * z_final
-
-        if dist == 'lognormal':
-            imputed[i] = np.exp(pred_val)
-        else:
-            imputed[i] = pred_val
+        pred_val = mu + sigma * z_final
+        imputed = np.exp(pred_val) if dist == 'lognormal' else pred_val
 
         # Clamp to bounds to ensure numerical precision didn't violate constraints
         # Especially important for stochastic sampling near edges
-        if not np.isinf(l_i):
-            imputed[i] = max(imputed[i], l_i)
-        if not np.isinf(r_i):
-            imputed[i] = min(imputed[i], r_i)
+        imputed = np.where(~np.isinf(left) & (left > imputed), left, imputed)
+        imputed = np.where(~np.isinf(right) & (right < imputed), right, imputed)
 
-    # Explicitly preserve exact observations to avoid floating point drift
-    # where left == right
-    mask_exact = (left == right)
-    imputed[mask_exact] = left[mask_exact]
+        # If sigma is 0, we can't divide: use the location itself (unclamped).
+        flat = np.abs(sigma) < 1e-12
+        imputed = np.where(flat, np.exp(mu) if dist == 'lognormal' else mu, imputed)
 
-    if return_fit:
-        return imputed, r_squared
-    return imputed
+    return np.array(imputed, dtype=float)
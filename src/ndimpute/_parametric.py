@@ -1,8 +1,10 @@
+import warnings
 import numpy as np
+import pandas as pd
 from scipy.stats import weibull_min, norm, lognorm, CensoredData
-from scipy.special import gamma, gammaincc, gammainc
+from scipy.special import gamma, gammaincc, gammainc, log_ndtr
 
-def impute_right_conditional(values, is_censored, dist='lognormal', impute_type='mean', random_state=None):
+def impute_right_conditional(values, is_censored, dist='lognormal', impute_type='mean', random_state=None, init_params=None, params=None, return_params=False):
     """
     Imputes right-censored data using Conditional Mean Imputation (Vectorized) or Stochastic Imputation.
 
@@ -12,26 +14,36 @@ def impute_right_conditional(values, is_censored, dist='lognormal', impute_type=
         dist (str): Distribution ('lognormal', 'normal', 'weibull').
         impute_type (str): 'mean' (default) or 'stochastic'.
         random_state (int, optional): Seed for reproducibility.
+        init_params (tuple or dict, optional): Starting point of the maximum
+            likelihood fit, e.g. the previous window's parameters.
+        params (tuple or dict, optional): Known parameters; skips fitting.
+        return_params (bool): If True, returns (imputed_values, params).
+            See `impute_mixed_parametric`. When nothing is censored the data
+            passes through and params are the supplied ones, or else the fit
+            on the observed values (None if they admit no fit, e.g.
+            non-positive values for lognormal / Weibull or a single distinct
+            value).
     """
     data = np.array(values)
     cens = np.array(is_censored, dtype=bool)
 
     if not np.any(cens):
-        return data.copy()
-
-    rng = np.random.default_rng(random_state) if impute_type == 'stochastic' else None
-
-    # Dispatch to specific distribution implementation
-    if dist == 'weibull': # Explicit Weibull
-        return _impute_right_weibull(data, cens, impute_type, rng)
-    elif dist == 'lognormal':
-        return _impute_right_lognormal(data, cens, impute_type, rng)
-    elif dist == 'normal':
-        return _impute_right_normal(data, cens, impute_type, rng)
-    else:
-        raise ValueError(f"Unknown distribution '{dist}' for parametric imputation.")
-
-def impute_mixed_parametric(values, status, dist='lognormal', impute_type='mean', random_state=None):
+        if not return_params:
+            return data.copy()
+        if dist not in _PARAM_NAMES:
+            raise ValueError(f"Unknown distribution '{dist}' for parametric imputation.")
+        if params is not None:
+            return data.copy(), _params_dict(dist, _as_params(params, dist))
+        if not _fittable(data, dist):
+            return data.copy(), None
+        return impute_mixed_parametric(data, np.zeros(len(data), dtype=int), dist=dist,
+                                       init_params=init_params, return_params=True)
+
+    status = np.where(cens, 1, 0)
+    return impute_mixed_parametric(data, status, dist=dist, impute_type=impute_type, random_state=random_state,
+                                   init_params=init_params, params=params, return_params=return_params)
+
+def impute_mixed_parametric(values, status, dist='lognormal', impute_type='mean', random_state=None, init_params=None, params=None, return_params=False):
     """
     Imputes mixed-censored data using Conditional Mean Imputation or Stochastic Imputation.
 
@@ -41,79 +53,614 @@ def impute_mixed_parametric(values, status, dist='lognormal', impute_type='mean'
         dist (str): Distribution ('lognormal', 'normal', 'weibull').
         impute_type (str): 'mean' (default) or 'stochastic'.
         random_state (int, optional): Seed for reproducibility.
+        init_params (tuple or dict, optional): Starting point of the maximum
+            likelihood fit, e.g. the previous window's parameters; a good
+            start converges in a couple of Newton steps.
+        params (tuple or dict, optional): Known parameters; skips fitting
+            and only imputes.
+        return_params (bool): If True, returns (imputed_values, params) with
+            params a dict {'dist', 'mu', 'sigma'} (log scale for lognormal)
+            or {'dist', 'shape', 'scale'} for Weibull. It can be passed back
+            as `init_params` or `params`.
+
+        Parameters are given as (mu, sigma) / (shape, scale) tuples or as
+        such a dict.
     """
     data = np.array(values)
     status = np.array(status, dtype=int)
 
+    if dist not in _PARAM_NAMES:
+        raise ValueError(f"Unknown distribution '{dist}' for parametric imputation.")
+
     # Masks
     mask_obs = (status == 0)
     mask_left = (status == -1)
     mask_right = (status == 1)
 
     rng = np.random.default_rng(random_state) if impute_type == 'stochastic' else None
+    init_params = _as_params(init_params, dist)
+    params = _as_params(params, dist)
 
     if dist == 'weibull':
-         return _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type, rng)
+         imputed, fitted = _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type, rng, init_params, params)
     elif dist == 'lognormal':
-         return _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type, rng)
-    elif dist == 'normal':
-         return _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type, rng)
+         imputed, fitted = _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type, rng, init_params, params)
     else:
-         raise ValueError(f"Unknown distribution '{dist}' for parametric imputation.")
+         imputed, fitted = _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type, rng, init_params, params)
 
-# --- Internal Implementations ---
+    if return_params:
+        return imputed, _params_dict(dist, fitted)
+    return imputed
+
+_PARAM_NAMES = {
+    'normal': ('mu', 'sigma'),
+    'lognormal': ('mu', 'sigma'),
+    'weibull': ('shape', 'scale'),
+}
+
+def _as_params(params, dist):
+    """
+    Parameter tuple from a (mu, sigma) / (shape, scale) sequence or a dict
+    (or Series) as returned with return_params.
+    """
+    if params is None:
+        return None
 
-def _impute_right_weibull(data, cens, impute_type='mean', rng=None):
+    names = _PARAM_NAMES[dist]
+    if hasattr(params, 'keys'):
+        if params.get('dist', dist) != dist:
+            raise ValueError(f"Parameters were fitted for dist='{params['dist']}', not '{dist}'.")
+        params = [params[name] for name in names]
+
+    params = tuple(float(p) for p in params)
+    if len(params) != 2 or not np.all(np.isfinite(params)) or params[1] <= 0 or (dist == 'weibull' and params[0] <= 0):
+        raise ValueError(f"Invalid {dist} parameters {params}; expected finite {names} with positive scale.")
+    return params
+
+def _params_dict(dist, params):
+    # Inverse of `_as_params`: the dict returned with return_params
+    return dict(zip(('dist',) + _PARAM_NAMES[dist], (dist,) + tuple(float(p) for p in params)))
+
+def _fittable(data, dist):
+    """
+    True if uncensored data admits a fit with positive scale: finite values,
+    positive for lognormal / Weibull, and at least two distinct ones.
     """
-    Imputes right-censored data using Weibull distribution.
+    if not np.all(np.isfinite(data)) or (dist != 'normal' and np.any(data <= 0)):
+        return False
+    return len(np.unique(data)) > 1
+
+def impute_parametric_grouped(values, status, groups, dist='lognormal', impute_type='mean', random_state=None, return_fit=False, max_iter=100, tol=1e-10):
+    """
+    Imputes censored data with a separate parametric fit per group, solving
+    all groups in one vectorized pass.
+
+    Normal and lognormal data are a normal location-scale family (on the
+    log scale for lognormal) and Weibull data a smallest-extreme-value
+    family on the log scale, so every group is fitted by the same Newton
+    iteration on (location, log scale) with segmented sums. Groups drop out
+    as they converge. Groups the batched solve cannot fit fall back to the
+    single-group fit. Groups where that fails too (e.g. no observed values)
+    are imputed as NaN with a warning.
 
     Args:
-        data (array): All data points.
-        cens (bool array): True if right-censored.
-        impute_type (str): 'mean' or 'stochastic'.
-        rng (np.random.Generator, optional): Random number generator.
+        values (array): Data values.
+        status (array): Censoring status (-1: Left, 0: Obs, 1: Right).
+        groups (array): Group label of each row.
+        dist (str): Distribution ('lognormal', 'normal', 'weibull').
+        impute_type (str): 'mean' (default) or 'stochastic'.
+        random_state (int, optional): Seed for reproducibility.
+        return_fit (bool): If True, returns (imputed_values, fits) where fits
+            is a DataFrame indexed by group with the fitted parameters
+            ('mu', 'sigma' on the log scale for lognormal; 'shape', 'scale'
+            for Weibull), 'n', 'n_censored', 'converged' and 'iterations' of
+            the batched solve (False for groups refit by the fallback).
+        max_iter (int): Maximum Newton iterations per group.
+        tol (float): Convergence tolerance on the Newton step.
+    """
+    data = np.array(values, dtype=float)
+    status = np.array(status, dtype=int)
+    groups = np.asarray(groups)
+
+    if dist not in ['normal', 'lognormal', 'weibull']:
+        raise ValueError(f"Unknown distribution '{dist}' for parametric imputation.")
+    if dist in ['lognormal', 'weibull'] and (data <= 0).any():
+        raise ValueError(f"Values must be positive for {dist} distribution.")
+
+    group_ids, row_group = np.unique(groups, return_inverse=True)
+    row_group = row_group.ravel()
+    n_groups = len(group_ids)
+
+    # 1. Batched location-scale fit of every group
+    y = data if dist == 'normal' else np.log(data)
+    family = 'sev' if dist == 'weibull' else 'normal'
+    theta, converged, iterations = _batched_location_scale_mle(y, status, row_group, n_groups, family, max_iter, tol)
+
+    # Groups without any spread have no scale to fit
+    lowest = np.full(n_groups, np.inf)
+    highest = np.full(n_groups, -np.inf)
+    np.minimum.at(lowest, row_group, y)
+    np.maximum.at(highest, row_group, y)
+    failed = highest <= lowest
+    theta[failed] = np.nan
+    converged[failed] = False
+
+    # Single-group fits for groups the batched solve did not settle
+    for g in np.flatnonzero(~converged & ~failed):
+        mask = row_group == g
+        sub, st = data[mask], status[mask]
+        try:
+            with np.errstate(all='ignore'):
+                if dist == 'weibull':
+                    shape, scale = fit_censored_weibull(sub[st == 0], sub[st == -1], sub[st == 1])
+                    theta[g] = np.log(scale), -np.log(shape)
+                else:
+                    ys = y[mask]
+                    mu, sigma = fit_censored_normal(ys[st == 0], ys[st == -1], ys[st == 1])
+                    theta[g] = mu, np.log(sigma)
+        except Exception:
+            theta[g] = np.nan
+        failed[g] = not np.all(np.isfinite(theta[g]))
+
+    if np.any(failed):
+        warnings.warn(f"Parametric fit failed for {np.sum(failed)} group(s); their censored values are set to NaN.")
+
+    if dist == 'weibull':
+        params = {'shape': np.exp(-theta[:, 1]), 'scale': np.exp(theta[:, 0])}
+    else:
+        params = {'mu': theta[:, 0], 'sigma': np.exp(theta[:, 1])}
+
+    # 2. Impute every row with its group's parameters
+    mask_left = status == -1
+    mask_right = status == 1
+    rng = np.random.default_rng(random_state) if impute_type == 'stochastic' else None
+    row_params = [p[row_group] for p in params.values()]
+
+    with np.errstate(invalid='ignore'):
+        if dist == 'weibull':
+            imputed = _impute_weibull(data, mask_left, mask_right, *row_params, impute_type, rng)
+        elif dist == 'lognormal':
+            imputed = _impute_lognormal(data, mask_left, mask_right, *row_params, impute_type, rng)
+        else:
+            imputed = _impute_normal(data, mask_left, mask_right, *row_params, impute_type, rng)
+    imputed[failed[row_group] & (status != 0)] = np.nan
+
+    if return_fit:
+        fits = pd.DataFrame(params, index=pd.Index(group_ids, name='group'))
+        fits['n'] = np.bincount(row_group, minlength=n_groups)
+        fits['n_censored'] = np.bincount(row_group, weights=(status != 0), minlength=n_groups).astype(int)
+        fits['converged'] = converged
+        fits['iterations'] = iterations
+        return imputed, fits
+    return imputed
+
+# --- Maximum Likelihood ---
+
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+
+def fit_censored_normal(observed, left=(), right=(), max_iter=100, tol=1e-10, init_params=None):
+    """
+    Maximum likelihood fit of a normal distribution to censored data.
+
+    Newton's method on (mu, log sigma) with the closed-form score and
+    Hessian (censored terms via log_ndtr and inverse Mills ratios), started
+    from the moments of the data with limits substituted. Steps are halved
+    until the log-likelihood increases, and replaced by gradient ascent
+    where the Hessian is not negative definite. Falls back to
+    `scipy.stats.norm.fit` if no finite maximum is found (e.g. no observed
+    values).
+
+    Args:
+        observed (array): Uncensored values.
+        left (array): Left-censoring limits (value < limit).
+        right (array): Right-censoring limits (value > limit).
+        max_iter (int): Maximum number of Newton steps.
+        tol (float): Convergence tolerance on the step size.
+        init_params (tuple, optional): Starting (mu, sigma) instead of the
+            moments, e.g. a previous fit.
 
     Returns:
-        array: Imputed data.
+        tuple: (mu, sigma)
     """
-    uncensored_vals = data[~cens]
-    censored_vals = data[cens]
-    cd = CensoredData(uncensored=uncensored_vals, right=censored_vals)
-    shape, loc, scale = weibull_min.fit(cd, floc=0)
+    observed = np.asarray(observed, dtype=float)
+    left = np.asarray(left, dtype=float)
+    right = np.asarray(right, dtype=float)
+
+    # Moment-based start
+    pooled = np.concatenate((observed, left, right))
+    if init_params is not None:
+        theta = np.array([init_params[0], np.log(init_params[1])])
+    else:
+        theta = np.array([pooled.mean(), np.log(pooled.std())]) if len(pooled) > 1 else np.array([np.nan, np.nan])
 
-    imputed = data.copy()
-    C = data[cens]
+    converged = False
+    if len(observed) > 0 and np.all(np.isfinite(theta)):
+        theta, converged, _, _ = _newton_maximize(lambda t: _normal_loglik(t, observed, left, right), theta, max_iter, tol)
 
-    if impute_type == 'stochastic':
-        # Sample from truncated Weibull > C
-        # CDF(x) = 1 - exp(-(x/scale)^shape)
-        # We need to sample U ~ Uniform(CDF(C), 1)
-        # Then x = CDF_inv(U) = scale * (-ln(1-U))^(1/shape)
+    if not converged:
+        cd = CensoredData(uncensored=observed, left=left, right=right)
+        return norm.fit(cd)
+
+    return theta[0], np.exp(theta[1])
 
-        cdf_C = 1.0 - np.exp(-(C / scale) ** shape)
-        # Ensure cdf_C is strictly < 1.0
-        cdf_C = np.minimum(cdf_C, 1.0 - 1e-9)
+def _newton_maximize(loglik, theta, max_iter=100, tol=1e-10):
+    """
+    Maximizes a two-parameter log-likelihood by Newton's method.
 
-        u = rng.uniform(low=cdf_C, high=1.0)
-        # Avoid log(0) if u is exactly 1 (which shouldn't happen with uniform[low, 1.0) usually, but safe guard)
-        u = np.minimum(u, 1.0 - 1e-15)
+    Steps are halved until the log-likelihood improves; where the Hessian is
+    not negative definite a scaled gradient step is taken instead.
 
-        sampled_val = scale * (-np.log(1.0 - u)) ** (1.0 / shape)
-        imputed[cens] = sampled_val
+    Args:
+        loglik (callable): theta -> (log-likelihood, gradient, Hessian).
+        theta (array): Starting point.
+
+    Returns:
+        tuple: (theta, converged, iterations, log_likelihood)
+    """
+    ll, grad, hess = loglik(theta)
+    for iteration in range(1, max_iter + 1):
+        # Newton direction, or gradient ascent off the concave region
+        if hess[0, 0] < 0 and np.linalg.det(hess) > 0:
+            step = -np.linalg.solve(hess, grad)
+        else:
+            step = grad / max(1.0, np.abs(grad).max())
+
+        # Step halving until the likelihood improves
+        for _ in range(30):
+            new_ll, new_grad, new_hess = loglik(theta + step)
+            if np.isfinite(new_ll) and new_ll >= ll:
+                break
+            step = step / 2
+        else:
+            return theta, False, iteration, ll
+
+        theta = theta + step
+        ll, grad, hess = new_ll, new_grad, new_hess
+        if np.abs(step).max() < tol:
+            return theta, True, iteration, ll
+
+    return theta, False, max_iter, ll
+
+def _normal_loglik(theta, observed, left, right):
+    """
+    Censored normal log-likelihood with its gradient and Hessian in
+    (mu, log sigma).
+    """
+    mu, eta = theta
+    sigma = np.exp(eta)
+
+    # Observed: -log(sigma) - z^2 / 2
+    z = (observed - mu) / sigma
+    ll = np.sum(-eta - 0.5 * z**2 - _LOG_SQRT_2PI)
+    grad = np.array([np.sum(z) / sigma, np.sum(z**2 - 1.0)])
+    hess = np.array([[-len(z) / sigma**2, -2 * np.sum(z) / sigma],
+                     [-2 * np.sum(z) / sigma, -2 * np.sum(z**2)]])
+
+    # Censored: log Phi(w) with w = (L - mu) / sigma (left) or
+    # (mu - R) / sigma (right); dw/dmu = sign / sigma, dw/dlog(sigma) = -w
+    for limits, sign in ((left, -1.0), (right, 1.0)):
+        if len(limits) == 0:
+            continue
+        w = sign * (mu - limits) / sigma
+        log_cdf = log_ndtr(w)
+        mills = np.exp(-0.5 * w**2 - _LOG_SQRT_2PI - log_cdf)
+        curv = 1.0 - w * (w + mills)
+
+        ll += np.sum(log_cdf)
+        grad += [sign * np.sum(mills) / sigma, -np.sum(mills * w)]
+        hess += [[-np.sum(mills * (w + mills)) / sigma**2, -sign * np.sum(mills * curv) / sigma],
+                 [-sign * np.sum(mills * curv) / sigma, np.sum(mills * w * curv)]]
+
+    return ll, grad, hess
+
+def fit_censored_weibull(observed, left=(), right=(), max_iter=100, tol=1e-10, return_diagnostics=False, init_params=None):
+    """
+    Maximum likelihood fit of a two-parameter Weibull distribution to
+    censored data.
+
+    Without left censoring the scale has a closed form given the shape,
+    lambda^k = sum(t^k) / r over all values t and r observed ones, and the
+    shape solves the one-dimensional profile score equation
+    1/k + mean(log x_obs) - sum(t^k log t) / sum(t^k) = 0. It is found
+    with a bracketed Newton iteration on the analytic derivative.
+
+    With left censoring there is no closed-form scale. The fit is then
+    Newton's method on the log-scale (smallest extreme value) location
+    and log scale, with closed-form score and Hessian.
+
+    Falls back to `scipy.stats.weibull_min.fit` if neither converges.
+
+    Args:
+        observed (array): Uncensored values.
+        left (array): Left-censoring limits (value < limit).
+        right (array): Right-censoring limits (value > limit).
+        max_iter (int): Maximum number of Newton steps.
+        tol (float): Convergence tolerance (relative step in the shape).
+        return_diagnostics (bool): If True, also returns a dict with
+            'method' ('profile', 'newton' or 'scipy'), 'iterations',
+            'converged' and 'log_likelihood'.
+        init_params (tuple, optional): Starting (shape, scale) instead of
+            the moments, e.g. a previous fit.
+
+    Returns:
+        tuple: (shape, scale), plus diagnostics if return_diagnostics.
+    """
+    observed = np.asarray(observed, dtype=float)
+    left = np.asarray(left, dtype=float)
+    right = np.asarray(right, dtype=float)
+    if np.any(observed <= 0) or np.any(left <= 0) or np.any(right <= 0):
+        raise ValueError("Values must be positive for Weibull distribution.")
+
+    y_obs, y_left, y_right = np.log(observed), np.log(left), np.log(right)
+    y_all = np.concatenate((y_obs, y_left, y_right))
+
+    method, converged, iterations = 'newton', False, 0
+    if len(y_obs) > 0 and np.ptp(y_all) > 0:
+        # Moment start: log T is extreme-value with scale pi / (sqrt(6) k)
+        shape0 = np.pi / (np.sqrt(6.0) * max(y_all.std(), 1e-8))
+        log_scale0 = y_all.mean() + np.euler_gamma / shape0
+        if init_params is not None:
+            shape0, log_scale0 = init_params[0], np.log(init_params[1])
+
+        if len(y_left) == 0:
+            method = 'profile'
+            shape, converged, iterations = _weibull_profile_shape(y_obs, np.concatenate((y_obs, y_right)), shape0, max_iter, tol)
+            # Closed-form scale, shifted by the largest value for stability
+            u = np.concatenate((y_obs, y_right))
+            top = u.max()
+            log_scale = top + (np.log(np.sum(np.exp(shape * (u - top)))) - np.log(len(y_obs))) / shape
+            theta = np.array([log_scale, -np.log(shape)])
+        else:
+            theta = np.array([log_scale0, -np.log(shape0)])
+            theta, converged, iterations, _ = _newton_maximize(lambda t: _sev_loglik(t, y_obs, y_left, y_right), theta, max_iter, tol)
+
+    if converged:
+        shape, scale = np.exp(-theta[1]), np.exp(theta[0])
     else:
-        u_c = (C / scale) ** shape
-        mean_unconditional = scale * gamma(1 + 1.0/shape)
-        integral_upper = mean_unconditional * gammaincc(1.0 + 1.0/shape, u_c)
-        S_C = np.exp(-u_c)
-        valid_mask = S_C > 1e-15
-        expected_val = C.copy()
-        expected_val[valid_mask] = integral_upper[valid_mask] / S_C[valid_mask]
-        expected_val[~valid_mask] = C[~valid_mask] # Fallback
-        imputed[cens] = expected_val
+        method = 'scipy'
+        cd = CensoredData(uncensored=observed, left=left, right=right)
+        shape, _, scale = weibull_min.fit(cd, floc=0)
+
+    if not return_diagnostics:
+        return shape, scale
+
+    # Log-likelihood on the original scale (log-density Jacobian -log x)
+    ll = _sev_loglik(np.array([np.log(scale), -np.log(shape)]), y_obs, y_left, y_right)[0] - np.sum(y_obs)
+    diagnostics = {
+        'method': method,
+        'iterations': iterations,
+        'converged': converged,
+        'log_likelihood': ll,
+    }
+    return shape, scale, diagnostics
+
+def _weibull_profile_shape(y_obs, y_all, shape, max_iter=100, tol=1e-10):
+    """
+    Root of the Weibull profile score in the shape, for exact and
+    right-censored data (log values y_obs and y_all).
 
-    return imputed
+    The score g(k) = 1/k + mean(y_obs) - sum(w y) / sum(w), w = exp(k y),
+    is strictly decreasing; Newton steps that leave the current bracket are
+    replaced by bisection.
 
-def _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None):
+    Returns:
+        tuple: (shape, converged, iterations)
+    """
+    # Shift by the largest value; g is invariant and exp(k u) cannot overflow
+    u_all = y_all - y_all.max()
+    mean_obs = np.mean(y_obs - y_all.max())
+    lo, hi = 0.0, np.inf
+
+    for iteration in range(1, max_iter + 1):
+        w = np.exp(shape * u_all)
+        w_mean = np.sum(w * u_all) / np.sum(w)
+        w_var = np.sum(w * (u_all - w_mean)**2) / np.sum(w)
+        g = 1.0 / shape + mean_obs - w_mean
+        dg = -1.0 / shape**2 - w_var
+
+        if g > 0:
+            lo = shape
+        else:
+            hi = shape
+
+        new_shape = shape - g / dg
+        if not (lo < new_shape < hi):
+            new_shape = 0.5 * (lo + hi) if np.isfinite(hi) else 2.0 * shape
+
+        if abs(new_shape - shape) < tol * shape:
+            return new_shape, True, iteration
+        shape = new_shape
+
+    return shape, False, max_iter
+
+def _sev_loglik(theta, y_obs, y_left, y_right):
+    """
+    Censored smallest-extreme-value log-likelihood of log Weibull data, with
+    its gradient and Hessian in (log scale, -log shape).
+    """
+    mu, eta = theta
+    b = np.exp(eta)
+
+    parts = []
+    # Observed: -log b + z - e^z; d/dz = 1 - e^z, d2/dz2 = -e^z
+    z = (y_obs - mu) / b
+    q = np.exp(z)
+    ll = np.sum(z - q) - len(z) * eta
+    parts.append((z, 1.0 - q, -q))
+
+    # Right: log S = -e^z
+    if len(y_right):
+        z = (y_right - mu) / b
+        q = np.exp(z)
+        ll -= np.sum(q)
+        parts.append((z, -q, -q))
+
+    # Left: log F = log(1 - exp(-e^z)); d/dz = h = q / expm1(q),
+    # d2/dz2 = h (1 - q - h)
+    if len(y_left):
+        z = (y_left - mu) / b
+        q = np.exp(z)
+        # Far-off trial steps can overflow; their -inf likelihood is rejected
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            h = q / np.expm1(q)
+            ll += np.sum(np.log(-np.expm1(-q)))
+        parts.append((z, h, h * (1.0 - q - h)))
+
+    z, d1, d2 = (np.concatenate(a) for a in zip(*parts))
+
+    # Chain rule with dz/dmu = -1/b, dz/deta = -z
+    grad = np.array([-np.sum(d1) / b, -np.sum(d1 * z) - len(y_obs)])
+    cross = np.sum(d2 * z + d1) / b
+    hess = np.array([[np.sum(d2) / b**2, cross],
+                     [cross, np.sum(d2 * z**2 + d1 * z)]])
+    return ll, grad, hess
+
+def _batched_location_scale_mle(y, status, row_group, n_groups, family='normal', max_iter=100, tol=1e-10):
+    """
+    Newton MLE of a censored location-scale family for many groups at once.
+
+    Each group's parameters are theta = (location, log scale) on the scale
+    of `y`; the iteration is `_newton_maximize` applied to every active
+    group with segmented sums.
+
+    Args:
+        y (array): Values (log values for lognormal / Weibull).
+        status (array): -1 left-censored, 0 observed, 1 right-censored.
+        row_group (array): Group index (0..n_groups-1) of each row.
+        family (str): 'normal' or 'sev' (smallest extreme value, log Weibull).
+
+    Returns:
+        tuple: (theta (G, 2), converged (G,), iterations (G,))
+    """
+    n_obs = np.bincount(row_group, weights=(status == 0), minlength=n_groups)
+    count = np.bincount(row_group, minlength=n_groups)
+
+    # Moment start per group
+    safe = np.maximum(count, 1)
+    mean = np.bincount(row_group, weights=y, minlength=n_groups) / safe
+    std = np.sqrt(np.bincount(row_group, weights=(y - mean[row_group])**2, minlength=n_groups) / safe)
+    if family == 'sev':
+        std = std * np.sqrt(6.0) / np.pi
+        mean = mean + np.euler_gamma * std
+    with np.errstate(divide='ignore'):
+        theta = np.column_stack((mean, np.log(std)))
+
+    converged = np.zeros(n_groups, dtype=bool)
+    iterations = np.zeros(n_groups, dtype=int)
+    active = (n_obs > 0) & (count > 1) & np.isfinite(theta[:, 1])
+
+    def evaluate(theta, groups, with_derivs=True):
+        rows = np.flatnonzero(np.isin(row_group, groups)) if len(groups) < n_groups else np.arange(len(y))
+        local = np.searchsorted(groups, row_group[rows])
+        return _location_scale_terms(theta, y[rows], status[rows], local, len(groups), family, with_derivs)
+
+    groups = np.flatnonzero(active)
+    if len(groups):
+        ll, grad, hess = evaluate(theta[groups], groups)
+
+    for iteration in range(1, max_iter + 1):
+        if len(groups) == 0:
+            break
+        iterations[groups] = iteration
+
+        # Newton direction, or gradient ascent off the concave region
+        det = hess[:, 0, 0] * hess[:, 1, 1] - hess[:, 0, 1]**2
+        newton = (hess[:, 0, 0] < 0) & (det > 0)
+        safe_det = np.where(newton, det, 1.0)
+        step = np.column_stack((
+            -(hess[:, 1, 1] * grad[:, 0] - hess[:, 0, 1] * grad[:, 1]) / safe_det,
+            -(hess[:, 0, 0] * grad[:, 1] - hess[:, 0, 1] * grad[:, 0]) / safe_det,
+        ))
+        ascent = grad / np.maximum(1.0, np.abs(grad).max(axis=1))[:, None]
+        step = np.where(newton[:, None], step, ascent)
+
+        # Step halving until the likelihood improves, group by group
+        pending = np.ones(len(groups), dtype=bool)
+        for _ in range(30):
+            idx = np.flatnonzero(pending)
+            trial = evaluate(theta[groups[idx]] + step[idx], groups[idx], with_derivs=False)[0]
+            ok = np.isfinite(trial) & (trial >= ll[idx])
+            pending[idx[ok]] = False
+            step[idx[~ok]] /= 2
+            if not pending.any():
+                break
+
+        # Groups whose step could not improve stop unconverged
+        keep = ~pending
+        theta[groups[keep]] += step[keep]
+        done = keep & (np.abs(step).max(axis=1) < tol)
+        converged[groups[done]] = True
+
+        groups = groups[keep & ~done]
+        if len(groups):
+            ll, grad, hess = evaluate(theta[groups], groups)
+
+    return theta, converged, iterations
+
+def _location_scale_terms(theta, y, status, row_group, n_groups, family, with_derivs=True):
+    """
+    Per-group censored log-likelihood (and gradient / Hessian in
+    (location, log scale)) of a normal or smallest-extreme-value family.
+    """
+    mu, eta = theta[:, 0], theta[:, 1]
+    b = np.exp(eta)
+    z = (y - mu[row_group]) / b[row_group]
+
+    obs, left, right = status == 0, status == -1, status == 1
+    ell = np.empty(len(z))
+    d1 = np.empty(len(z))
+    d2 = np.empty(len(z))
+
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        if family == 'normal':
+            # Observed: -z^2 / 2; censored: log Phi(w), w = z (left) or -z (right)
+            ell[obs] = -0.5 * z[obs]**2 - _LOG_SQRT_2PI
+            d1[obs], d2[obs] = -z[obs], -1.0
+            for mask, sign in ((left, 1.0), (right, -1.0)):
+                w = sign * z[mask]
+                log_cdf = log_ndtr(w)
+                mills = np.exp(-0.5 * w**2 - _LOG_SQRT_2PI - log_cdf)
+                ell[mask] = log_cdf
+                d1[mask] = sign * mills
+                d2[mask] = -mills * (w + mills)
+        else:
+            # Observed: z - e^z; right: -e^z; left: log(1 - exp(-e^z))
+            q = np.exp(z)
+            ell[obs] = z[obs] - q[obs]
+            d1[obs], d2[obs] = 1.0 - q[obs], -q[obs]
+            ell[right] = -q[right]
+            d1[right], d2[right] = -q[right], -q[right]
+            h = q[left] / np.expm1(q[left])
+            ell[left] = np.log(-np.expm1(-q[left]))
+            d1[left], d2[left] = h, h * (1.0 - q[left] - h)
+
+    n_obs = np.bincount(row_group, weights=obs, minlength=n_groups)
+    ll = np.bincount(row_group, weights=ell, minlength=n_groups) - n_obs * eta
+    if not with_derivs:
+        return ll, None, None
+
+    # Chain rule with dz/dmu = -1/b, dz/deta = -z
+    def seg(w):
+        return np.bincount(row_group, weights=w, minlength=n_groups)
+
+    grad = np.column_stack((-seg(d1) / b, -seg(d1 * z) - n_obs))
+    cross = seg(d2 * z + d1) / b
+    hess = np.empty((n_groups, 2, 2))
+    hess[:, 0, 0] = seg(d2) / b**2
+    hess[:, 0, 1] = hess[:, 1, 0] = cross
+    hess[:, 1, 1] = seg(d2 * z**2 + d1 * z)
+    return ll, grad, hess
+
+# --- Internal Implementations ---
+
+def _per_row(param, mask):
+    """
+    Parameter values for the rows in `mask`: scalars pass through, per-row
+    arrays (batched fits) are subset.
+    """
+    return param if np.ndim(param) == 0 else param[mask]
+
+def _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None, init_params=None, params=None):
     """
     Imputes mixed-censored data using Weibull distribution.
 
@@ -124,35 +671,44 @@ def _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type='me
         mask_right (bool array): True if right-censored.
         impute_type (str): 'mean' or 'stochastic'.
         rng (np.random.Generator, optional): Random number generator.
+        init_params (tuple, optional): Starting (shape, scale) of the fit.
+        params (tuple, optional): Known (shape, scale); skips fitting.
 
     Returns:
-        array: Imputed data.
+        tuple: (imputed data, (shape, scale))
+    """
+    if params is None:
+        params = fit_censored_weibull(data[mask_obs], data[mask_left], data[mask_right], init_params=init_params)
+    shape, scale = params
+    return _impute_weibull(data, mask_left, mask_right, shape, scale, impute_type, rng), (shape, scale)
+
+def _impute_weibull(data, mask_left, mask_right, shape, scale, impute_type='mean', rng=None):
     """
-    cd = CensoredData(
-        uncensored=data[mask_obs],
-        left=data[mask_left],
-        right=data[mask_right]
-    )
-    shape, loc, scale = weibull_min.fit(cd, floc=0)
+    Imputes censored values from fitted Weibull parameters (scalars, or
+    per-row arrays for batched fits).
 
+    Returns:
+        array: Imputed data.
+    """
     imputed = data.copy()
-    mean_unconditional = scale * gamma(1 + 1.0/shape)
 
     if np.any(mask_left):
         L = data[mask_left]
+        k, lam = _per_row(shape, mask_left), _per_row(scale, mask_left)
         if impute_type == 'stochastic':
             # Sample from truncated Weibull < L
             # U ~ Uniform(0, CDF(L))
-            cdf_L = 1.0 - np.exp(-(L / scale) ** shape)
+            cdf_L = 1.0 - np.exp(-(L / lam) ** k)
             cdf_L = np.maximum(cdf_L, 1e-9) # Avoid 0 range
 
             u = rng.uniform(low=0.0, high=cdf_L)
-            sampled_val = scale * (-np.log(1.0 - u)) ** (1.0 / shape)
+            sampled_val = lam * (-np.log(1.0 - u)) ** (1.0 / k)
             imputed[mask_left] = sampled_val
         else:
-            u_L = (L / scale) ** shape
+            mean_unconditional = lam * gamma(1 + 1.0/k)
+            u_L = (L / lam) ** k
             F_L = 1.0 - np.exp(-u_L)
-            integral_lower = mean_unconditional * gammainc(1.0 + 1.0/shape, u_L)
+            integral_lower = mean_unconditional * gammainc(1.0 + 1.0/k, u_L)
             valid_mask = F_L > 1e-15
             vals = L.copy()
             vals[valid_mask] = integral_lower[valid_mask] / F_L[valid_mask]
@@ -161,20 +717,27 @@ def _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type='me
 
     if np.any(mask_right):
         R = data[mask_right]
+        k, lam = _per_row(shape, mask_right), _per_row(scale, mask_right)
         if impute_type == 'stochastic':
             # Sample from truncated Weibull > R
-            cdf_R = 1.0 - np.exp(-(R / scale) ** shape)
+            # CDF(x) = 1 - exp(-(x/scale)^shape)
+            # We need to sample U ~ Uniform(CDF(R), 1)
+            # Then x = CDF_inv(U) = scale * (-ln(1-U))^(1/shape)
+            cdf_R = 1.0 - np.exp(-(R / lam) ** k)
+            # Ensure cdf_R is strictly < 1.0
             cdf_R = np.minimum(cdf_R, 1.0 - 1e-9)
 
             u = rng.uniform(low=cdf_R, high=1.0)
+            # Avoid log(0) if u is exactly 1
             u = np.minimum(u, 1.0 - 1e-15)
 
-            sampled_val = scale * (-np.log(1.0 - u)) ** (1.0 / shape)
+            sampled_val = lam * (-np.log(1.0 - u)) ** (1.0 / k)
             imputed[mask_right] = sampled_val
         else:
-            u_R = (R / scale) ** shape
+            mean_unconditional = lam * gamma(1 + 1.0/k)
+            u_R = (R / lam) ** k
             S_R = np.exp(-u_R)
-            integral_upper = mean_unconditional * gammaincc(1.0 + 1.0/shape, u_R)
+            integral_upper = mean_unconditional * gammaincc(1.0 + 1.0/k, u_R)
             valid_mask = S_R > 1e-15
             vals = R.copy()
             vals[valid_mask] = integral_upper[valid_mask] / S_R[valid_mask]
@@ -183,7 +746,7 @@ def _impute_mixed_weibull(data, mask_obs, mask_left, mask_right, impute_type='me
 
     return imputed
 
-def _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None):
+def _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None, init_params=None, params=None):
     """
     Imputes mixed-censored data using Normal distribution.
 
@@ -194,89 +757,80 @@ def _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type='mea
         mask_right (bool array): True if right-censored.
         impute_type (str): 'mean' or 'stochastic'.
         rng (np.random.Generator, optional): Random number generator.
+        init_params (tuple, optional): Starting (mu, sigma) of the fit.
+        params (tuple, optional): Known (mu, sigma); skips fitting.
 
     Returns:
-        array: Imputed data.
+        tuple: (imputed data, (mu, sigma))
     """
     # Fit Normal
-    cd = CensoredData(
-        uncensored=data[mask_obs],
-        left=data[mask_left],
-        right=data[mask_right]
-    )
-    mu, std = norm.fit(cd)
+    if params is None:
+        params = fit_censored_normal(data[mask_obs], data[mask_left], data[mask_right], init_params=init_params)
+    mu, std = params
+    return _impute_normal(data, mask_left, mask_right, mu, std, impute_type, rng), (mu, std)
 
+def _impute_normal(data, mask_left, mask_right, mu, std, impute_type='mean', rng=None):
+    """
+    Imputes censored values from fitted Normal parameters (scalars, or
+    per-row arrays for batched fits).
+
+    Returns:
+        array: Imputed data.
+    """
     imputed = data.copy()
 
     # E[X | X < L]
     if np.any(mask_left):
         L = data[mask_left]
+        m, sd = _per_row(mu, mask_left), _per_row(std, mask_left)
         if impute_type == 'stochastic':
             # Truncated Normal < L
             # U ~ Uniform(0, CDF(L))
-            z_L = (L - mu) / std
+            z_L = (L - m) / sd
             cdf_L = norm.cdf(z_L)
             cdf_L = np.maximum(cdf_L, 1e-9)
 
             u = rng.uniform(low=0.0, high=cdf_L)
             z_sampled = norm.ppf(u)
-            imputed[mask_left] = mu + std * z_sampled
+            imputed[mask_left] = m + sd * z_sampled
         else:
-            z = (L - mu) / std
+            z = (L - m) / sd
             pdf_z = norm.pdf(z)
             cdf_z = norm.cdf(z)
             valid = cdf_z > 1e-15
             impute_vals = L.copy()
-            impute_vals[valid] = mu - std * (pdf_z[valid] / cdf_z[valid])
+            impute_vals[valid] = _per_row(m, valid) - _per_row(sd, valid) * (pdf_z[valid] / cdf_z[valid])
             impute_vals[~valid] = L[~valid]
             imputed[mask_left] = impute_vals
 
     # E[X | X > R]
     if np.any(mask_right):
         R = data[mask_right]
+        m, sd = _per_row(mu, mask_right), _per_row(std, mask_right)
         if impute_type == 'stochastic':
             # Truncated Normal > R
             # U ~ Uniform(CDF(R), 1)
-            z_R = (R - mu) / std
+            z_R = (R - m) / sd
             cdf_R = norm.cdf(z_R)
             cdf_R = np.minimum(cdf_R, 1.0 - 1e-9)
 
             u = rng.uniform(low=cdf_R, high=1.0)
             u = np.minimum(u, 1.0 - 1e-15)
             z_sampled = norm.ppf(u)
-            imputed[mask_right] = mu + std * z_sampled
+            imputed[mask_right] = m + sd * z_sampled
         else:
-            z = (R - mu) / std
+            z = (R - m) / sd
             pdf_z = norm.pdf(z)
             sf_z = 1.0 - norm.cdf(z)
             valid = sf_z > 1e-15
             impute_vals = R.copy()
-            impute_vals[valid] = mu + std * (pdf_z[valid] / sf_z[valid])
+            impute_vals[valid] = _per_row(m, valid) + _per_row(sd, valid) * (pdf_z[valid] / sf_z[valid])
             impute_vals[~valid] = R[~valid]
             imputed[mask_right] = impute_vals
 
     return imputed
 
-def _impute_right_normal(data, cens, impute_type='mean', rng=None):
-    """
-    Imputes right-censored data using Normal distribution.
-
-    Args:
-        data (array): All data points.
-        cens (bool array): True if right-censored.
-        impute_type (str): 'mean' or 'stochastic'.
-        rng (np.random.Generator, optional): Random number generator.
-
-    Returns:
-        array: Imputed data.
-    """
-    # Specialized for Right Only (can reuse mixed logic)
-    mask_obs = ~cens
-    mask_left = np.zeros(len(data), dtype=bool)
-    mask_right = cens
-    return _impute_mixed_normal(data, mask_obs, mask_left, mask_right, impute_type, rng)
-
-def _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None):
+def _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type='mean', rng=None, init_params=None, params=None):
     """
     Imputes mixed-censored data using LogNormal distribution.
 
@@ -287,114 +841,95 @@ def _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type='
         mask_right (bool array): True if right-censored.
         impute_type (str): 'mean' or 'stochastic'.
         rng (np.random.Generator, optional): Random number generator.
+        init_params (tuple, optional): Starting log-scale (mu, sigma) of the fit.
+        params (tuple, optional): Known log-scale (mu, sigma); skips fitting.
 
     Returns:
-        array: Imputed data.
+        tuple: (imputed data, (mu, sigma))
     """
     if (data <= 0).any():
         raise ValueError("Values must be positive for lognormal distribution.")
 
-    log_data = np.log(data)
-
-    # We can reuse the normal implementation by operating on log data,
-    # then exponentiating the result for stochastic mode.
-    # For mean mode, we need the specific lognormal conditional expectation formula.
+    # Fit Normal on log data
+    if params is None:
+        log_data = np.log(data)
+        params = fit_censored_normal(log_data[mask_obs], log_data[mask_left], log_data[mask_right], init_params=init_params)
+    mu, std = params
+    return _impute_lognormal(data, mask_left, mask_right, mu, std, impute_type, rng), (mu, std)
 
-    if impute_type == 'stochastic':
-        # Fit Normal on log data
-        cd = CensoredData(
-            uncensored=log_data[mask_obs],
-            left=log_data[mask_left],
-            right=log_data[mask_right]
-        )
-        mu, std = norm.fit(cd)
+def _impute_lognormal(data, mask_left, mask_right, mu, std, impute_type='mean', rng=None):
+    """
+    Imputes censored values from fitted LogNormal parameters (log-scale mu
+    and std; scalars, or per-row arrays for batched fits).
 
-        imputed = data.copy()
+    Returns:
+        array: Imputed data.
+    """
+    imputed = data.copy()
 
+    # Stochastic mode samples the truncated normal on the log scale and
+    # exponentiates; mean mode needs the lognormal conditional expectation.
+    if impute_type == 'stochastic':
         if np.any(mask_left):
             L = data[mask_left]
+            m, sd = _per_row(mu, mask_left), _per_row(std, mask_left)
             ln_L = np.log(L)
-            z_L = (ln_L - mu) / std
+            z_L = (ln_L - m) / sd
             cdf_L = norm.cdf(z_L)
             cdf_L = np.maximum(cdf_L, 1e-9)
 
             u = rng.uniform(low=0.0, high=cdf_L)
             z_sampled = norm.ppf(u)
-            imputed[mask_left] = np.exp(mu + std * z_sampled)
+            imputed[mask_left] = np.exp(m + sd * z_sampled)
 
         if np.any(mask_right):
             R = data[mask_right]
+            m, sd = _per_row(mu, mask_right), _per_row(std, mask_right)
             ln_R = np.log(R)
-            z_R = (ln_R - mu) / std
+            z_R = (ln_R - m) / sd
             cdf_R = norm.cdf(z_R)
             cdf_R = np.minimum(cdf_R, 1.0 - 1e-9)
 
             u = rng.uniform(low=cdf_R, high=1.0)
             u = np.minimum(u, 1.0 - 1e-15)
             z_sampled = norm.ppf(u)
-            imputed[mask_right] = np.exp(mu + std * z_sampled)
+            imputed[mask_right] = np.exp(m + sd * z_sampled)
 
         return imputed
 
     else:
-        # Mean mode requires the specific integral formula implemented previously
-        # Fit on log data
-        cd = CensoredData(
-            uncensored=log_data[mask_obs],
-            left=log_data[mask_left],
-            right=log_data[mask_right]
-        )
-        mu, std = norm.fit(cd)
-
-        imputed = data.copy()
         mean_unconditional = np.exp(mu + 0.5 * std**2)
 
         if np.any(mask_left):
             L = data[mask_left]
+            m, sd = _per_row(mu, mask_left), _per_row(std, mask_left)
             ln_L = np.log(L)
-            alpha = (ln_L - mu) / std
+            alpha = (ln_L - m) / sd
 
             Phi_alpha = norm.cdf(alpha)
-            Phi_shifted = norm.cdf(alpha - std)
+            Phi_shifted = norm.cdf(alpha - sd)
 
             valid = Phi_alpha > 1e-15
             vals = L.copy()
-            vals[valid] = mean_unconditional * (Phi_shifted[valid] / Phi_alpha[valid])
+            vals[valid] = _per_row(_per_row(mean_unconditional, mask_left), valid) * (Phi_shifted[valid] / Phi_alpha[valid])
             vals[~valid] = L[~valid] # Fallback
 
             imputed[mask_left] = vals
 
         if np.any(mask_right):
             R = data[mask_right]
+            m, sd = _per_row(mu, mask_right), _per_row(std, mask_right)
             ln_R = np.log(R)
-            alpha = (ln_R - mu) / std
+            alpha = (ln_R - m) / sd
 
             Sf_alpha = 1.0 - norm.cdf(alpha)
-            Sf_shifted = 1.0 - norm.cdf(alpha - std)
+            Sf_shifted = 1.0 - norm.cdf(alpha - sd)
 
             valid = Sf_alpha > 1e-15
             vals = R.copy()
-            vals[valid] = mean_unconditional * (Sf_shifted[valid] / Sf_alpha[valid])
+            vals[valid] = _per_row(_per_row(mean_unconditional, mask_right), valid) * (Sf_shifted[valid] / Sf_alpha[valid])
             vals[~valid] = R[~valid] # Fallback
 
             imputed[mask_right] = vals
 
         return imputed
-
-def _impute_right_lognormal(data, cens, impute_type='mean', rng=None):
-    """
-    Imputes right-censored data using LogNormal distribution.
-
-    Args:
-        data (array): All data points.
-        cens (bool array): True if right-censored.
-        impute_type (str): 'mean' or 'stochastic'.
-        rng (np.random.Generator, optional): Random number generator.
-
-    Returns:
-        array: Imputed data.
-    """
-    mask_obs = ~cens
-    mask_left = np.zeros(len(data), dtype=bool)
-    mask_right = cens
-    return _impute_mixed_lognormal(data, mask_obs, mask_left, mask_right, impute_type, rng)
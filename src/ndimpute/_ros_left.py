@@ -1,8 +1,165 @@
 import numpy as np
-import pandas as pd
-from scipy.stats import norm, linregress, ecdf, CensoredData
+from scipy.stats import norm, linregress
 
-def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='kaplan-meier', return_fit=False, **kwargs):
+_KM_POSITIONS = ('kaplan-meier', 'ecdf', 'hirsch-stedinger')
+
+def plotting_positions(values, is_censored, censoring='left'):
+    """
+    Hirsch-Stedinger plotting positions for data with multiple detection
+    limits, scaled by n / (n + 1) to stay inside (0, 1).
+
+    The Kaplan-Meier probability below each value is the product, over the
+    distinct uncensored values at or above it, of (n - d) / n (n: number of
+    values at or below, d: uncensored ties). It is computed in one
+    O(n log n) pass with a sort, a reverse cumulative product and a
+    search, and matches the survival function of `scipy.stats.ecdf` on the
+    negated data.
+
+    Positions depend only on the ordering of the values, so they can be
+    cached and shared by every candidate distribution (and by monotone
+    transforms of the data).
+
+    Args:
+        values (array): Observed values (detection limit for censored).
+        is_censored (bool array): True if value is censored.
+        censoring (str): 'left' (default, censored means <) or 'right'
+            (censored means >). Right-censored positions are those of the
+            reversed left-censored problem solved by Reverse ROS, i.e.
+            exceedance probabilities.
+
+    Returns:
+        tuple: (pp_unc, pp_limits) plotting positions of the uncensored values
+        and of the censoring limits, in input order.
+    """
+    values = np.asarray(values, dtype=float)
+    is_censored = np.asarray(is_censored, dtype=bool)
+    if censoring == 'right':
+        values = -values
+    elif censoring != 'left':
+        raise ValueError(f"Unknown censoring '{censoring}'. Expected 'left' or 'right'.")
+    n = len(values)
+    knots, below = km_curve(values, is_censored)
+
+    # PPs for Uncensored
+    pp_unc = below[np.searchsorted(knots, values[~is_censored], side='left')]
+
+    # Scaling to avoid 0 and 1
+    pp_unc = pp_unc * (n / (n + 1))
+    pp_unc[pp_unc == 0] = 0.5 / (n + 1)
+    pp_unc[pp_unc == 1] = 1.0 - (0.5 / (n + 1))
+
+    # PPs for the censoring limits
+    pp_limits = limit_positions((knots, below), values[is_censored], n)
+
+    return pp_unc, pp_limits
+
+def km_curve(values, is_censored):
+    """
+    Kaplan-Meier (Hirsch-Stedinger) probability below each distinct
+    uncensored value of left-censored data.
+
+    Args:
+        values (array): Observed values (detection limit for censored).
+        is_censored (bool array): True if value is censored (<).
+
+    Returns:
+        tuple: (knots, below) the sorted distinct uncensored values and
+        P(X < knot), with a trailing 1.0 for values above the last knot.
+    """
+    # Distinct uncensored values with their tie counts (d) and the number of
+    # values at or below each (n at risk in the reversed time scale)
+    knots, d = np.unique(values[~is_censored], return_counts=True)
+    at_risk = np.searchsorted(np.sort(values), knots, side='right')
+
+    # Probability below each distinct value: product of the factors from the
+    # largest value down (censoring-only values contribute a factor of 1)
+    factors = (at_risk - d) / at_risk
+    below = np.append(np.cumprod(factors[::-1])[::-1], 1.0)
+    return knots, below
+
+def limit_positions(curve, limits, n):
+    """
+    Plotting positions of censoring limits on a fitted `km_curve`, scaled by
+    n / (n + 1) for the n values the curve was fitted on.
+
+    Args:
+        curve (tuple): (knots, below) from `km_curve`.
+        limits (array): Censoring limits.
+        n (int): Number of values behind the curve.
+
+    Returns:
+        array: P(X < limit) of each limit, kept above zero.
+    """
+    knots, below = curve
+    pp_limits = below[np.searchsorted(knots, limits, side='left')]
+
+    pp_limits = pp_limits * (n / (n + 1))
+    # Ensure non-zero to define tail
+    pp_limits[pp_limits == 0] = 0.5 / (n + 1)
+    return pp_limits
+
+def km_positions(values, is_censored):
+    """
+    Plotting positions for left-censored data, see `plotting_positions`.
+    """
+    return plotting_positions(values, is_censored)
+
+def ros_left_fit(values, is_censored, dist='lognormal', positions=None):
+    """
+    Fits the Kaplan-Meier ROS regression line without imputing.
+
+    Args:
+        values (array): Observed values (LOD for censored).
+        is_censored (bool array): True if value is censored (<).
+        dist (str): 'lognormal' or 'normal'.
+        positions (tuple, optional): Precomputed `km_positions(values, is_censored)`.
+
+    Returns:
+        tuple: (slope, intercept, r_squared)
+    """
+    values = np.array(values)
+    is_censored = np.array(is_censored, dtype=bool)
+    y_reg = _regression_response(values, is_censored, dist)
+
+    if positions is None:
+        positions = km_positions(values, is_censored)
+    z_unc = norm.ppf(positions[0])
+
+    slope, intercept, r_value, _, _ = linregress(z_unc, y_reg)
+    return slope, intercept, r_value**2
+
+def _regression_response(values, is_censored, dist):
+    """
+    Validates the data and returns the regression response (log-scale for
+    lognormal) of the uncensored values.
+    """
+    y_unc = values[~is_censored]
+
+    if len(y_unc) < 2:
+         raise ValueError("Too few uncensored observations to fit regression.")
+
+    if dist == 'lognormal':
+        if (values <= 0).any():
+             raise ValueError("Values must be positive for lognormal distribution.")
+        return np.log(y_unc)
+    elif dist == 'normal':
+        return y_unc
+    else:
+        raise ValueError(f"Unknown distribution '{dist}'")
+
+def _sort_order(values):
+    """
+    Ascending sort order of `values`, tie order included, as produced by
+    pandas `sort_values` (quicksort on the non-NaN values, NaNs last in
+    input order).
+    """
+    nan = np.isnan(values) if values.dtype.kind == 'f' else np.zeros(len(values), dtype=bool)
+    if not nan.any():
+        return np.argsort(values, kind='quicksort')
+    idx = np.arange(len(values))
+    return np.concatenate((idx[~nan][np.argsort(values[~nan], kind='quicksort')], idx[nan]))
+
+def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='kaplan-meier', return_fit=False, positions=None, **kwargs):
     """
     Imputes left-censored data using Robust ROS.
 
@@ -11,11 +168,14 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
         is_censored (bool array): True if value is censored (<).
         dist (str): Distribution assumption ('lognormal' or 'normal').
         plotting_position (str): Method for calculating plotting positions.
-            - 'kaplan-meier' (default): Uses Hirsch-Stedinger logic via scipy.stats.ecdf.
+            - 'kaplan-meier' (default): Uses Hirsch-Stedinger logic (see `plotting_positions`).
               Best for multiple detection limits.
             - 'simple' or 'weibull': Uses simple ranking (rank/(n+1)).
               Matches simple NADA approximations for single limits.
         return_fit (bool): If True, returns (imputed_values, r_squared).
+        positions (tuple, optional): Precomputed `km_positions(values, is_censored)`
+            for the Kaplan-Meier branch, e.g. shared across candidate
+            distributions.
         **kwargs:
             - impute_type (str): 'stochastic' (distribute/random) or 'mean' (default for KM).
               Note: 'simple' plotting_position is inherently 'stochastic' (quantile-based).
@@ -32,37 +192,13 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
     random_state = kwargs.get('random_state', None)
 
     # Common Setup: Log Transform if needed for regression Y
-    unc_mask = ~is_censored
-    y_unc = values[unc_mask]
-
-    if len(y_unc) < 2:
-         raise ValueError("Too few uncensored observations to fit regression.")
-
-    if dist == 'lognormal':
-        if (values <= 0).any():
-             raise ValueError("Values must be positive for lognormal distribution.")
-        y_reg = np.log(y_unc)
-    elif dist == 'normal':
-        y_reg = y_unc
-    else:
-        raise ValueError(f"Unknown distribution '{dist}'")
+    y_reg = _regression_response(values, is_censored, dist)
 
     # --- Branch 1: Kaplan-Meier (Hirsch-Stedinger) ---
-    if plotting_position in ['kaplan-meier', 'ecdf', 'hirsch-stedinger']:
-        neg_values = -values
-        unc_data = neg_values[~is_censored]
-        cens_data = neg_values[is_censored]
-
-        cd = CensoredData(uncensored=unc_data, right=cens_data)
-        res = ecdf(cd)
-
-        # PPs for Uncensored
-        pp_unc = res.sf.evaluate(-y_unc)
-
-        # Scaling to avoid 0 and 1
-        pp_unc = pp_unc * (n / (n + 1))
-        pp_unc[pp_unc == 0] = 0.5 / (n + 1)
-        pp_unc[pp_unc == 1] = 1.0 - (0.5 / (n + 1))
+    if plotting_position in _KM_POSITIONS:
+        if positions is None:
+            positions = km_positions(values, is_censored)
+        pp_unc, pp_limits = positions
 
         z_unc = norm.ppf(pp_unc)
 
@@ -71,105 +207,31 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
         r_squared = r_value**2
 
         # Impute
-        y_cens = values[is_censored]
-        pp_limits = res.sf.evaluate(-y_cens)
-
-        pp_limits = pp_limits * (n / (n + 1))
-        # Ensure non-zero to define tail
-        pp_limits[pp_limits == 0] = 0.5 / (n + 1)
-
-        z_limits = norm.ppf(pp_limits)
-
-        if impute_type == 'mean':
-            # Original Conditional Mean Logic
-            numerator = norm.pdf(z_limits)
-            denominator = norm.cdf(z_limits)
-            z_imputed = -numerator / denominator
-
-        else: # 'stochastic'
-            # Two sub-modes for 'stochastic':
-            # 1. Deterministic Quantile Spacing (Default if random_state is None).
-            #    Spreads points evenly to reconstruct shape.
-            # 2. Random Sampling (If random_state is provided).
-            #    Samples U[0, p_max] to preserve randomness.
-
-            z_imputed = np.zeros_like(z_limits)
-
-            if random_state is not None:
-                # True Stochastic Sampling
-                rng = np.random.default_rng(random_state)
-                # Sample uniform random numbers for each censored point
-                # Range [0, pp_limit]
-                # pp_limits is array of P(X < L) for each point
-                u_noise = rng.uniform(0, 1, size=len(y_cens))
-                p_rand = u_noise * pp_limits
-
-                # Handle edge case where p_rand could be 0
-                p_rand = np.clip(p_rand, 1e-15, 1.0 - 1e-15) # Should be < pp_limits anyway
-
-                z_imputed = norm.ppf(p_rand)
-
-            else:
-                # Deterministic Quantile Spacing (Original Robust ROS)
-                # Distribute censored values in the tail [0, P(X < L)]
-                # We group by limit to distribute them evenly in their respective tails.
-
-                # Identify unique limits to handle ties
-                # We iterate over unique limit values found in the censored set
-                unique_limits = np.unique(y_cens)
-
-                for lim in unique_limits:
-                    # Indices in the censored array corresponding to this limit
-                    # Note: y_cens is the subset array.
-                    idxs = np.where(y_cens == lim)[0]
-                    k = len(idxs)
-
-                    if k == 0: continue
-
-                    # Get the max probability for this limit
-                    # All these should have same pp_limit
-                    p_max = pp_limits[idxs[0]]
-
-                    # Generate spaced probabilities in (0, p_max]
-                    # Standard plotting position within the subset:
-                    # We want k points.
-                    # If we use (i / (k+1)) * p_max, we avoid 0 and p_max.
-                    # i ranges 1 to k.
-                    ranks_internal = np.arange(1, k + 1)
-                    p_sub = (ranks_internal / (k + 1)) * p_max
-
-                    # Map to Z
-                    z_sub = norm.ppf(p_sub)
-
-                    # Assign back (order doesn't matter for exchangeable censored values)
-                    z_imputed[idxs] = z_sub
-
-        predicted = intercept + slope * z_imputed
+        imputed_cens = ros_impute_censored(values[is_censored], pp_limits, slope, intercept, dist, impute_type, random_state)
 
     # --- Branch 2: Simple Ranking (Weibull) ---
     elif plotting_position in ['simple', 'weibull']:
-        # Sort data to assign ranks
-        df = pd.DataFrame({'val': values, 'cens': is_censored})
-        df = df.sort_values('val')
+        # Sort data to assign ranks (same order as pandas sort_values)
+        order = _sort_order(values)
+        sorted_vals = values[order]
+        sorted_cens = is_censored[order]
 
-        df['rank'] = np.arange(1, n + 1)
-        df['pp'] = df['rank'] / (n + 1)
-        df['z'] = norm.ppf(df['pp'])
+        pp = np.arange(1, n + 1) / (n + 1)
+        z = norm.ppf(pp)
 
         # Fit on Uncensored
-        y_reg_sorted = df.loc[~df['cens'], 'val']
+        y_reg_sorted = sorted_vals[~sorted_cens]
         if dist == 'lognormal':
             y_reg_sorted = np.log(y_reg_sorted)
 
-        x_obs = df.loc[~df['cens'], 'z']
+        x_obs = z[~sorted_cens]
 
         slope, intercept, r_value, _, _ = linregress(x_obs, y_reg_sorted)
         r_squared = r_value**2
 
         # Impute
-        z_cens = df.loc[df['cens'], 'z']
-        predicted_sorted = intercept + slope * z_cens
-        predicted = predicted_sorted
+        z_cens = z[sorted_cens]
+        predicted = intercept + slope * z_cens
 
     else:
         raise ValueError(f"Unknown plotting_position '{plotting_position}'.")
@@ -181,30 +243,103 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
         else:
             imputed_vals = predicted
 
-        df.loc[df['cens'], 'imputed'] = imputed_vals
-        limit_vals = df.loc[df['cens'], 'val']
-        df.loc[df['cens'], 'imputed'] = np.minimum(df.loc[df['cens'], 'imputed'], limit_vals)
+        imputed_vals = np.minimum(imputed_vals, sorted_vals[sorted_cens])
 
-        result = df.sort_index()['val'].copy()
-        result[is_censored] = df.sort_index().loc[is_censored, 'imputed']
+        # Scatter back to input order
+        result = values.astype(float)
+        result[order[sorted_cens]] = imputed_vals
 
         if return_fit:
-            return result.values, r_squared
-        return result.values
+            return result, r_squared
+        return result
 
     else:
         # Kaplan-Meier path
-        if dist == 'lognormal':
-            imputed_vals = np.exp(predicted)
-        else:
-            imputed_vals = predicted
-
-        y_cens = values[is_censored]
-        imputed_vals = np.minimum(imputed_vals, y_cens)
-
         result = values.copy()
-        result[is_censored] = imputed_vals
+        result[is_censored] = imputed_cens
 
         if return_fit:
             return result, r_squared
         return result
+
+def ros_impute_censored(y_cens, pp_limits, slope, intercept, dist='lognormal', impute_type='stochastic', random_state=None):
+    """
+    Imputes censored values from a fitted Kaplan-Meier ROS line.
+
+    Args:
+        y_cens (array): Censoring limits (LOD) of the censored values.
+        pp_limits (array): Plotting positions P(X < limit) of the limits.
+        slope (float): Regression slope.
+        intercept (float): Regression intercept.
+        dist (str): 'lognormal' or 'normal'.
+        impute_type (str): 'stochastic' (default) or 'mean', see `impute_ros_left`.
+        random_state (int, optional): Seed for random sampling in stochastic
+            mode; None spreads the values deterministically.
+
+    Returns:
+        array: Imputed values, capped at their limits.
+    """
+    z_limits = norm.ppf(pp_limits)
+
+    if impute_type == 'mean':
+        # Original Conditional Mean Logic
+        numerator = norm.pdf(z_limits)
+        denominator = norm.cdf(z_limits)
+        z_imputed = -numerator / denominator
+
+    else: # 'stochastic'
+        # Two sub-modes for 'stochastic':
+        # 1. Deterministic Quantile Spacing (Default if random_state is None).
+        #    Spreads points evenly to reconstruct shape.
+        # 2. Random Sampling (If random_state is provided).
+        #    Samples U[0, p_max] to preserve randomness.
+
+        z_imputed = np.zeros_like(z_limits)
+
+        if random_state is not None:
+            # True Stochastic Sampling
+            rng = np.random.default_rng(random_state)
+            # Sample uniform random numbers for each censored point
+            # Range [0, pp_limit]
+            # pp_limits is array of P(X < L) for each point
+            u_noise = rng.uniform(0, 1, size=len(y_cens))
+            p_rand = u_noise * pp_limits
+
+            # Handle edge case where p_rand could be 0
+            p_rand = np.clip(p_rand, 1e-15, 1.0 - 1e-15) # Should be < pp_limits anyway
+
+            z_imputed = norm.ppf(p_rand)
+
+        elif len(y_cens) > 0:
+            # Deterministic Quantile Spacing (Original Robust ROS)
+            # Distribute censored values in the tail [0, P(X < L)]
+            # We group by limit to distribute them evenly in their respective tails.
+
+            # Identify unique limits to handle ties. Ranks within each
+            # limit follow input order (stable sort), in one pass over all
+            # limits.
+            _, inverse, counts = np.unique(y_cens, return_inverse=True, return_counts=True)
+            inverse = inverse.ravel()
+            order = np.argsort(inverse, kind='stable')
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+            # Generate spaced probabilities in (0, p_max] per limit:
+            # (i / (k+1)) * p_max for i = 1..k avoids 0 and p_max.
+            # p_max is the plotting position of the limit's first point.
+            ranks_internal = np.empty(len(y_cens), dtype=int)
+            ranks_internal[order] = np.arange(len(y_cens)) - np.repeat(starts, counts) + 1
+            k = counts[inverse]
+            p_max = pp_limits[order[starts]][inverse]
+            p_sub = (ranks_internal / (k + 1)) * p_max
+
+            # Map to Z (NaN limits match no group and stay at 0)
+            z_imputed = np.where(np.isnan(y_cens), 0.0, norm.ppf(p_sub))
+
+    predicted = intercept + slope * z_imputed
+
+    if dist == 'lognormal':
+        imputed_vals = np.exp(predicted)
+    else:
+        imputed_vals = predicted
+
+    return np.minimum(imputed_vals, y_cens)
@@ -1,10 +1,10 @@
 import numpy as np
 from ._ros_left import impute_ros_left
 from ._ros_right import impute_ros_right
-from ._interval import impute_interval_ros
+from ._interval import interval_npmle, interval_ros_fit, interval_ros_impute, TURNBULL_OPTIONS
 import warnings
 
-def impute_ros_mixed_heuristic(values, status, return_fit=False, **kwargs):
+def impute_ros_mixed_heuristic(values, status, return_fit=False, return_diagnostics=False, npmle=None, **kwargs):
     """
     Imputes mixed-censored data using a rigorous Interval Imputation approach.
     (Formerly implemented as a sequential heuristic, now upgraded to Interval/Turnbull).
@@ -21,7 +21,13 @@ def impute_ros_mixed_heuristic(values, status, return_fit=False, **kwargs):
         values (array): Data values.
         status (array): Status codes (-1: Left, 0: Obs, 1: Right).
         return_fit (bool): If True, returns (imputed_values, r_squared).
-        **kwargs: Arguments passed (dist, plotting_position).
+        return_diagnostics (bool): If True, the Turnbull diagnostics dict is
+            appended to the result (None if the legacy fallback was used).
+        npmle (tuple, optional): Precomputed Turnbull NPMLE of
+            `mixed_to_intervals(values, status, dist)`, see `interval_npmle`.
+        **kwargs: Arguments passed (dist, plotting_position, impute_type,
+            random_state, accelerator, solver, prune_tol, warm_start,
+            coarsen, n_bins).
 
     Returns:
         array: Imputed values.
@@ -30,48 +36,107 @@ def impute_ros_mixed_heuristic(values, status, return_fit=False, **kwargs):
     status = np.array(status, dtype=int)
     dist = kwargs.get('dist', 'lognormal')
 
-    n = len(values)
-    left_bounds = np.zeros(n)
-    right_bounds = np.zeros(n)
-
     # 1. Convert to Interval Format
-    for i in range(n):
-        s = status[i]
-        v = values[i]
-
-        if s == 0: # Observed
-            left_bounds[i] = v
-            right_bounds[i] = v
-        elif s == -1: # Left Censored (< v)
-            if dist == 'lognormal':
-                left_bounds[i] = 0.0
-            else:
-                left_bounds[i] = -np.inf
-            right_bounds[i] = v
-        elif s == 1: # Right Censored (> v)
-            left_bounds[i] = v
-            right_bounds[i] = np.inf
-        else:
-            raise ValueError(f"Unknown status code {s}")
+    left_bounds, right_bounds = mixed_to_intervals(values, status, dist)
 
     # 2. Apply Interval ROS
     # Propagate impute_type (default 'stochastic') and random_state
     impute_type = kwargs.get('impute_type', 'stochastic')
     random_state = kwargs.get('random_state', None)
+    turnbull_kwargs = {k: kwargs[k] for k in TURNBULL_OPTIONS if k in kwargs}
 
     try:
-        result = impute_interval_ros(left_bounds, right_bounds, dist=dist, impute_type=impute_type, random_state=random_state, return_fit=return_fit)
+        npmle, (slope, intercept, r_squared) = _interval_fit(left_bounds, right_bounds, dist, npmle, turnbull_kwargs)
+        imputed = interval_ros_impute(left_bounds, right_bounds, slope, intercept, dist, impute_type, random_state)
+    except Exception as e:
+        # Fallback to legacy heuristic if Interval fails (e.g. convergence issues)
+        _warn_fallback(e)
+
+        result = _impute_ros_mixed_legacy(values, status, return_fit=return_fit, **kwargs)
+        if return_diagnostics:
+            return (*result, None) if return_fit else (result, None)
         return result
+
+    result = (imputed,)
+    if return_fit:
+        result += (r_squared,)
+    if return_diagnostics:
+        result += (npmle[2],)
+    return result if len(result) > 1 else imputed
+
+def mixed_ros_fit(values, status, dist='lognormal', npmle=None, **turnbull_kwargs):
+    """
+    Fits the mixed ROS model without imputing, with the same fallback as
+    `impute_ros_mixed_heuristic`.
+
+    Args:
+        values (array): Data values.
+        status (array): Status codes (-1: Left, 0: Obs, 1: Right).
+        dist (str): 'lognormal' or 'normal'.
+        npmle (tuple, optional): Precomputed Turnbull NPMLE, see
+            `impute_ros_mixed_heuristic`.
+        **turnbull_kwargs: Turnbull options (see TURNBULL_OPTIONS).
+
+    Returns:
+        tuple: (npmle, (slope, intercept, r_squared)), see `interval_ros_fit`.
+        If the interval fit fails a warning is issued and
+        (None, (nan, nan, nan)) is returned: the legacy heuristic that takes
+        over has no reusable fit.
+    """
+    values = np.array(values, dtype=float)
+    status = np.array(status, dtype=int)
+    left_bounds, right_bounds = mixed_to_intervals(values, status, dist)
+
+    try:
+        return _interval_fit(left_bounds, right_bounds, dist, npmle, turnbull_kwargs)
     except Exception as e:
-        # Check for specific failure modes we might want to handle silently or with specific advice
-        msg = str(e)
+        _warn_fallback(e)
+        return None, (np.nan, np.nan, np.nan)
 
-        # Fallback to legacy heuristic if Interval fails (e.g. convergence issues)
-        # We generally warn, unless it's a known edge case where fallback is standard.
-        warnings.warn(f"Interval ROS failed for Mixed Censoring: {msg}. Falling back to sequential heuristic.")
+def _interval_fit(left_bounds, right_bounds, dist, npmle, turnbull_kwargs):
+    """
+    Turnbull NPMLE and interval ROS regression of the interval form of mixed
+    data. Raises on failure.
+
+    Returns:
+        tuple: (npmle, (slope, intercept, r_squared))
+    """
+    if dist not in ['normal', 'lognormal']:
+        raise ValueError(f"Unknown distribution '{dist}'. Supported: 'normal', 'lognormal'.")
+    if npmle is None:
+        npmle = interval_npmle(left_bounds, right_bounds, **turnbull_kwargs)
+    return npmle, interval_ros_fit(npmle[0], npmle[1], dist)
+
+def _warn_fallback(error):
+    # We generally warn, unless it's a known edge case where fallback is standard.
+    warnings.warn(f"Interval ROS failed for Mixed Censoring: {error}. Falling back to sequential heuristic.")
+
+
+def mixed_to_intervals(values, status, dist='lognormal'):
+    """
+    Converts mixed-censored data to interval bounds: (0 or -inf, L] for left
+    censored, [x, x] for observed and [R, inf) for right censored values.
+
+    Args:
+        values (array): Data values.
+        status (array): Status codes (-1: Left, 0: Obs, 1: Right).
+        dist (str): 'lognormal' uses 0 as the lower bound of left-censored
+            values, otherwise -inf.
+
+    Returns:
+        tuple: (left_bounds, right_bounds)
+    """
+    values = np.asarray(values, dtype=float)
+    status = np.asarray(status, dtype=int)
 
-        return _impute_ros_mixed_legacy(values, status, return_fit=return_fit, **kwargs)
+    unknown = ~np.isin(status, [-1, 0, 1])
+    if np.any(unknown):
+        raise ValueError(f"Unknown status code {status[unknown][0]}")
 
+    lower_limit = 0.0 if dist == 'lognormal' else -np.inf
+    left_bounds = np.where(status == -1, lower_limit, values)
+    right_bounds = np.where(status == 1, np.inf, values)
+    return left_bounds, right_bounds
 
 def _impute_ros_mixed_legacy(values, status, return_fit=False, **kwargs):
     """
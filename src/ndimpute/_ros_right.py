@@ -1,4 +1,5 @@
-from ._ros_left import impute_ros_left
+import numpy as np
+from ._ros_left import impute_ros_left, plotting_positions, ros_left_fit, _KM_POSITIONS
 
 def impute_ros_right(values, is_censored, dist='lognormal', plotting_position='kaplan-meier', return_fit=False, **kwargs):
     """
@@ -14,6 +15,11 @@ def impute_ros_right(values, is_censored, dist='lognormal', plotting_position='k
             - impute_type (str): 'stochastic' (default) or 'mean'.
             - other kwargs passed to impute_ros_left.
     """
+    # Plotting positions of the reversed problem, computed once on the
+    # original scale (both reversals below give the same ordering)
+    if plotting_position in _KM_POSITIONS and kwargs.get('positions') is None:
+        kwargs['positions'] = km_positions_right(values, is_censored)
+
     # 1. Reverse domain
     # For lognormal (dist>0), we can't just flip sign and log.
     # Instead, we invert: y' = 1/y.
@@ -48,3 +54,42 @@ def impute_ros_right(values, is_censored, dist='lognormal', plotting_position='k
             return -imputed_flipped, r2
         else:
             return -result
+
+def km_positions_right(values, is_censored):
+    """
+    Kaplan-Meier plotting positions of the reversed (left-censored) problem
+    solved by `impute_ros_right`.
+
+    The lognormal (1 / y) and normal (-y) reversals order positive values
+    identically, so one set of positions serves both distributions.
+
+    Args:
+        values (array): Observed values (Censoring Limit for censored).
+        is_censored (bool array): True if value is censored (>).
+
+    Returns:
+        tuple: (pp_unc, pp_limits), see `km_positions`.
+    """
+    return plotting_positions(values, is_censored, censoring='right')
+
+def ros_right_fit(values, is_censored, dist='lognormal', positions=None):
+    """
+    Fits the Reverse ROS regression line without imputing.
+
+    Args:
+        values (array): Observed values (Censoring Limit for censored).
+        is_censored (bool array): True if value is censored (>).
+        dist (str): 'lognormal' or 'normal'.
+        positions (tuple, optional): Precomputed `km_positions_right(values, is_censored)`.
+
+    Returns:
+        tuple: (slope, intercept, r_squared) of the reversed problem.
+    """
+    values = np.asarray(values, dtype=float)
+
+    if dist == 'lognormal':
+        if (values <= 0).any():
+             raise ValueError("Values must be positive for lognormal distribution.")
+        return ros_left_fit(1.0 / values, is_censored, dist='lognormal', positions=positions)
+
+    return ros_left_fit(-values, is_censored, dist='normal', positions=positions)
@@ -1,11 +1,13 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from ._ros_left import impute_ros_left
-from ._ros_right import impute_ros_right
-from ._ros_mixed import impute_ros_mixed_heuristic
-from ._parametric import impute_right_conditional, impute_mixed_parametric
+from ._ros_left import impute_ros_left, km_positions, ros_left_fit, _KM_POSITIONS
+from ._ros_right import impute_ros_right, km_positions_right, ros_right_fit
+from ._ros_mixed import impute_ros_mixed_heuristic, mixed_ros_fit
+from ._parametric import impute_right_conditional, impute_mixed_parametric, impute_parametric_grouped
 from ._substitution import impute_sub_left, impute_sub_right, impute_sub_mixed
-from ._interval import impute_interval_ros
+from ._interval import impute_interval_ros, impute_interval_ros_grouped, interval_npmle, interval_ros_fit, TURNBULL_OPTIONS
 from ._preprocess import detect_and_parse
 
 def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
@@ -27,6 +29,47 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
             - Defaults to 'left' if status is provided but type is not.
             - Defaults to inferred type if status is None.
         **kwargs: Additional arguments (dist, plotting_position, strategy, impute_type, random_state, etc.)
+            - accelerator (str): Turnbull EM acceleration for interval / mixed ROS
+              (None, 'squarem' or 'aitken'; 'squarem' is recommended).
+            - solver (str): Turnbull NPMLE algorithm for interval / mixed ROS
+              ('em' or 'em-icm').
+            - prune_tol (float): Active-set pruning threshold for the Turnbull
+              estimator (interval / mixed ROS).
+            - warm_start (tuple): Previous Turnbull (intervals, probs) used as the
+              EM starting point (interval / mixed ROS).
+            - coarsen (str, float or array): Approximate Turnbull mode that snaps
+              endpoints onto a grid ('quantile', a resolution or grid points)
+              before fitting (interval / mixed ROS).
+            - n_bins (int): Number of quantile bins for coarsen='quantile'.
+            - groups (array-like): Group label per row for interval ROS and the
+              parametric method. Each group gets its own Turnbull / regression
+              or maximum likelihood fit, solved in one batched pass; per-group
+              fits are stored in `df.attrs['group_fits']`.
+            - init_params (tuple or dict): Starting parameters of the parametric
+              maximum likelihood fit, e.g. `df.attrs['params']` of a previous
+              window.
+            - params (tuple or dict): Known parametric parameters ((mu, sigma),
+              log scale for lognormal, or (shape, scale) for Weibull); skips
+              fitting. The parameters used are stored in `df.attrs['params']`.
+            - n_jobs (int): Number of workers scoring the dist='auto' candidates
+              concurrently (default 1; -1 uses all CPUs). The result is the
+              same as in serial mode.
+            - backend (str): 'thread' (default) or 'process' pool for n_jobs.
+            - selection_sample (int or 'auto'): Score the dist='auto' candidates
+              on a stratified subsample of this many rows (keeping the censored
+              fraction and the detection-limit mix), then run only the winner
+              on the full data. 'auto' samples 20,000 rows when N > 100,000
+              and the candidates cannot share a nonparametric stage (mixed
+              data, simple plotting positions).
+              The rows used and the R^2 gap between the best and second-best
+              candidate are stored in `df.attrs['selection_sample']` and
+              `df.attrs['score_gap']`.
+            - selection_random_state (int): Seed of the selection subsample
+              (default 0), independent of `random_state`.
+            Interval and mixed ROS store the Turnbull convergence diagnostics
+            (iterations, converged flag, per-phase wall time, log-likelihood
+            trace, support size; see `turnbull_em`) in
+            `df.attrs['turnbull_diagnostics']`.
 
     Returns:
         pd.DataFrame: A dataframe containing:
@@ -98,6 +141,14 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
     plotting_position = kwargs.get('plotting_position', 'kaplan-meier')
     impute_type_arg = kwargs.get('impute_type') # None if not present
     random_state = kwargs.get('random_state', None)
+    turnbull_kwargs = {k: kwargs[k] for k in TURNBULL_OPTIONS if k in kwargs}
+    selection_kwargs = {
+        'n_jobs': kwargs.get('n_jobs', None),
+        'backend': kwargs.get('backend', 'thread'),
+        'sample': kwargs.get('selection_sample', None),
+        'sample_random_state': kwargs.get('selection_random_state', 0),
+    }
+    selection = None
 
     if censoring_type == 'interval':
         # Values should be (N, 2)
@@ -111,35 +162,32 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
         fit_score = None
         best_dist = None
         imputed_vals = None
+        groups = kwargs.get('groups', None)
+        group_fits = None
+        diagnostics = None
 
         if method == 'ros':
             it = impute_type_arg if impute_type_arg is not None else 'stochastic'
 
-            if dist == 'auto':
+            if groups is not None:
+                 if dist == 'auto':
+                     raise ValueError("dist='auto' is not supported together with 'groups'.")
+                 imputed_vals, group_fits, _ = impute_interval_ros_grouped(left, right, groups, dist=dist, impute_type=it, random_state=random_state, return_fit=True)
+
+            elif dist == 'auto':
                  # Select best distribution
-                 candidates = ['lognormal', 'normal']
-                 best_r2 = -1.0
-
-                 for d in candidates:
-                     try:
-                         # Sanity check for lognormal: bounds must be positive (except 0 if left censored)
-                         # _interval.py handles 0 for lognormal internally.
-                         curr_vals, curr_r2 = impute_interval_ros(left, right, dist=d, impute_type=it, random_state=random_state, return_fit=True)
-
-                         if curr_r2 > best_r2:
-                             best_r2 = curr_r2
-                             best_dist = d
-                             imputed_vals = curr_vals
-                     except Exception:
-                         continue
-
-                 if imputed_vals is None:
+                 best_dist, reuse, selection = _auto_select((left, right), None, 'interval', None, turnbull_kwargs, **selection_kwargs)
+
+                 if best_dist is None:
                      raise ValueError("Auto-distribution selection failed for interval data.")
 
-                 fit_score = best_r2
+                 if not reuse:
+                     # Selected on a subsample: fit the winner on the full data.
+                     reuse = turnbull_kwargs
+                 imputed_vals, fit_score, diagnostics = impute_interval_ros(left, right, dist=best_dist, impute_type=it, random_state=random_state, return_fit=True, return_diagnostics=True, **reuse)
 
             else:
-                 imputed_vals = impute_interval_ros(left, right, dist=dist, impute_type=it, random_state=random_state)
+                 imputed_vals, diagnostics = impute_interval_ros(left, right, dist=dist, impute_type=it, random_state=random_state, return_diagnostics=True, **turnbull_kwargs)
 
         else:
             raise NotImplementedError(f"Method '{method}' not implemented for interval censoring.")
@@ -152,10 +200,20 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
             'is_imputed': True
         })
 
+        if groups is not None:
+             df.insert(1, 'group', np.asarray(groups))
+             df.attrs['group_fits'] = group_fits
+
         if fit_score is not None:
              df.attrs['fit_score'] = fit_score
              df.attrs['best_dist'] = best_dist
 
+        if selection is not None:
+             df.attrs.update(selection)
+
+        if diagnostics is not None:
+             df.attrs['turnbull_diagnostics'] = diagnostics
+
         return df
 
     # ... Existing Logic for Left/Right/Mixed ...
@@ -186,53 +244,34 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
     # --- Auto Distribution Selection ---
     fit_score = None
     best_dist = None
+    diagnostics = None
+    groups = kwargs_prop.pop('groups', None)
+    group_fits = None
+    param_kwargs = {'init_params': kwargs_prop.pop('init_params', None), 'params': kwargs_prop.pop('params', None)}
+    params = None
+
+    if groups is not None and method != 'parametric':
+        raise ValueError("'groups' is supported for interval ROS and method='parametric' only.")
+    if groups is not None and any(v is not None for v in param_kwargs.values()):
+        raise ValueError("'init_params' and 'params' are not supported together with 'groups'.")
 
     if dist == 'auto' and method == 'ros':
         # Select best distribution from candidates
-        candidates = ['lognormal', 'normal']
-        best_r2 = -1.0
-        selected_vals = None
-
-        for d in candidates:
-            try:
-                # Sanity check for lognormal: data must be positive
-                if d == 'lognormal':
-                    if censoring_type in ['left', 'right'] and np.any(values <= 0):
-                        continue
-                    # For mixed, values might be < LOD. But if observed values are <= 0, lognormal is invalid.
-                    if censoring_type == 'mixed':
-                         # Status 0 is observed.
-                         observed = values[status == 0]
-                         if np.any(observed <= 0):
-                             continue
-
-                # Run imputation with fit metric
-                curr_vals = None
-                curr_r2 = -1.0
-
-                if censoring_type == 'left':
-                    curr_vals, curr_r2 = impute_ros_left(values, status, dist=d, plotting_position=plotting_position, return_fit=True, **kwargs_prop)
-                elif censoring_type == 'right':
-                    curr_vals, curr_r2 = impute_ros_right(values, status, dist=d, plotting_position=plotting_position, return_fit=True, **kwargs_prop)
-                elif censoring_type == 'mixed':
-                    curr_vals, curr_r2 = impute_ros_mixed_heuristic(values, status, dist=d, plotting_position=plotting_position, return_fit=True, **kwargs_prop)
-
-                # Check fit
-                if curr_r2 > best_r2:
-                    best_r2 = curr_r2
-                    best_dist = d
-                    selected_vals = curr_vals
-
-            except Exception:
-                # Candidate failed (e.g. lognormal on negative data or regression failure)
-                continue
-
-        if selected_vals is None:
+        best_dist, reuse, selection = _auto_select(values, status, censoring_type, plotting_position, turnbull_kwargs, **selection_kwargs)
+
+        if best_dist is None:
             raise ValueError("Auto-distribution selection failed. No valid distribution found for data (or regression failed).")
 
+        # Impute with the winner only, reusing its nonparametric stage
+        if censoring_type == 'left':
+            selected_vals, fit_score = impute_ros_left(values, status, dist=best_dist, plotting_position=plotting_position, return_fit=True, **kwargs_prop, **reuse)
+        elif censoring_type == 'right':
+            selected_vals, fit_score = impute_ros_right(values, status, dist=best_dist, plotting_position=plotting_position, return_fit=True, **kwargs_prop, **reuse)
+        else:
+            selected_vals, fit_score, diagnostics = impute_ros_mixed_heuristic(values, status, dist=best_dist, plotting_position=plotting_position, return_fit=True, return_diagnostics=True, **kwargs_prop, **reuse)
+
         dist = best_dist # Update for record
         imputed_vals = selected_vals
-        fit_score = best_r2
 
         # Skip standard dispatch below by marking method as handled
         method = 'DONE_AUTO'
@@ -255,7 +294,10 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
             imputed_vals = impute_ros_right(values, status, dist=dist, plotting_position=plotting_position, **kwargs_prop)
         elif method == 'parametric':
             it = impute_type_arg if impute_type_arg is not None else 'mean'
-            imputed_vals = impute_right_conditional(values, status, dist=dist, impute_type=it, random_state=random_state)
+            if groups is not None:
+                imputed_vals, group_fits = impute_parametric_grouped(values, status.astype(int), groups, dist=dist, impute_type=it, random_state=random_state, return_fit=True)
+            else:
+                imputed_vals, params = impute_right_conditional(values, status, dist=dist, impute_type=it, random_state=random_state, return_params=True, **param_kwargs)
         elif method == 'substitution':
             strategy = kwargs.get('strategy', 'value')
             multiplier = kwargs.get('multiplier', None)
@@ -266,7 +308,10 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
     elif censoring_type == 'mixed':
         if method == 'parametric':
             it = impute_type_arg if impute_type_arg is not None else 'mean'
-            imputed_vals = impute_mixed_parametric(values, status, dist=dist, impute_type=it, random_state=random_state)
+            if groups is not None:
+                imputed_vals, group_fits = impute_parametric_grouped(values, status, groups, dist=dist, impute_type=it, random_state=random_state, return_fit=True)
+            else:
+                imputed_vals, params = impute_mixed_parametric(values, status, dist=dist, impute_type=it, random_state=random_state, return_params=True, **param_kwargs)
         elif method == 'substitution':
             # Extract mixed kwargs
             left_kwargs = {
@@ -285,7 +330,7 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
                 "Validation suggests using method='parametric' for higher accuracy.",
                 UserWarning
             )
-            imputed_vals = impute_ros_mixed_heuristic(values, status, dist=dist, plotting_position=plotting_position, **kwargs_prop)
+            imputed_vals, diagnostics = impute_ros_mixed_heuristic(values, status, dist=dist, plotting_position=plotting_position, return_diagnostics=True, **kwargs_prop)
         else:
             raise ValueError(f"Unknown method '{method}' for mixed censoring.")
 
@@ -299,8 +344,239 @@ def impute(values, status=None, method='ros', censoring_type=None, **kwargs):
         'is_imputed': is_imputed
     })
 
+    if groups is not None:
+        df.insert(1, 'group', np.asarray(groups))
+        df.attrs['group_fits'] = group_fits
+
+    if params is not None:
+        df.attrs['params'] = params
+
     if fit_score is not None:
         df.attrs['fit_score'] = fit_score
         df.attrs['best_dist'] = best_dist
 
+    if selection is not None:
+        df.attrs.update(selection)
+
+    if diagnostics is not None:
+        df.attrs['turnbull_diagnostics'] = diagnostics
+
     return df
+
+_AUTO_CANDIDATES = ('lognormal', 'normal')
+_BACKENDS = ('thread', 'process')
+
+def _select_ros_dist(values, status, censoring_type, plotting_position, turnbull_kwargs, n_jobs=None, backend='thread'):
+    """
+    Scores the candidate distributions of dist='auto' (_AUTO_CANDIDATES, in
+    order of preference) by the R^2 of their ROS regression, without
+    imputing.
+
+    The nonparametric stage is computed once where it does not depend on the
+    distribution: Kaplan-Meier positions for left / right censoring and the
+    Turnbull NPMLE for interval data. Mixed data needs one NPMLE per
+    candidate, as left-censored values start at 0 (lognormal) or -inf.
+    Candidates are independent, so with n_jobs > 1 they are scored on a
+    thread or process pool; results are collected in candidate order, so the
+    selection matches serial mode.
+
+    Args:
+        values (array or tuple): Values, or (left, right) for interval data.
+        status (array): Censoring indicator (None for interval data).
+        censoring_type (str): 'left', 'right', 'mixed' or 'interval'.
+        plotting_position (str): ROS plotting position (left / right).
+        turnbull_kwargs (dict): Turnbull options (mixed / interval).
+        n_jobs (int, optional): Number of workers (-1 for all CPUs).
+        backend (str): 'thread' or 'process'.
+
+    Returns:
+        tuple: (best_dist, best_r2, reuse, scores)
+            best_dist: Winning candidate (None if all failed). Ties go to
+                       the earlier candidate.
+            reuse: Keyword arguments (positions / npmle) that let the winner's
+                   imputation skip its nonparametric stage.
+            scores: R^2 of each candidate (None if it failed).
+    """
+    candidates = _AUTO_CANDIDATES
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Supported: 'thread', 'process'.")
+
+    try:
+        shared = _shared_stage(values, status, censoring_type, plotting_position, turnbull_kwargs)
+    except Exception:
+        return None, -1.0, {}, [None] * len(candidates)
+
+    tasks = [(d, values, status, censoring_type, plotting_position, turnbull_kwargs, shared) for d in candidates]
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs is None or n_jobs <= 1 or len(tasks) < 2:
+        results = [_score_candidate(*task) for task in tasks]
+    else:
+        pool = ThreadPoolExecutor if backend == 'thread' else ProcessPoolExecutor
+        with pool(max_workers=min(n_jobs, len(tasks))) as executor:
+            results = list(executor.map(_score_candidate, *zip(*tasks)))
+
+    best_dist, best_r2, reuse = None, -1.0, {}
+    for d, result in zip(candidates, results):
+        # Check fit (failed candidates return None)
+        if result is not None and result[0] > best_r2:
+            best_dist, (best_r2, reuse) = d, result
+
+    scores = [None if result is None else result[0] for result in results]
+    return best_dist, best_r2, reuse, scores
+
+_SELECTION_THRESHOLD = 100_000
+_SELECTION_SIZE = 20_000
+
+def _auto_select(values, status, censoring_type, plotting_position, turnbull_kwargs, sample=None, sample_random_state=0, **selection_kwargs):
+    """
+    Runs `_select_ros_dist`, optionally on a stratified subsample.
+
+    Args:
+        sample (int or 'auto', optional): Number of rows to score the
+            candidates on. 'auto' uses _SELECTION_SIZE rows when N exceeds
+            _SELECTION_THRESHOLD and each candidate needs its own fit (mixed
+            data, simple plotting positions). None or a size >= N uses all
+            rows.
+        sample_random_state (int): Seed of the subsample.
+        **selection_kwargs: n_jobs and backend.
+
+    Returns:
+        tuple: (best_dist, reuse, selection)
+            reuse: Shared nonparametric stage for the winner (empty when the
+                   candidates were scored on a subsample).
+            selection: Record for df.attrs with 'selection_sample' (rows
+                       scored) and 'score_gap' (best minus second-best R^2,
+                       NaN with fewer than two valid candidates).
+    """
+    n = len(values[0]) if censoring_type == 'interval' else len(values)
+
+    if sample == 'auto':
+        # Where the nonparametric stage is shared, scoring a candidate on the
+        # full data is a single regression and subsampling saves nothing.
+        shared = censoring_type == 'interval' or (censoring_type in ('left', 'right') and plotting_position in _KM_POSITIONS)
+        sample = _SELECTION_SIZE if n > _SELECTION_THRESHOLD and not shared else None
+    elif sample is not None and (isinstance(sample, str) or int(sample) < 2):
+        raise ValueError("selection_sample must be an integer >= 2 or 'auto'.")
+
+    subsampled = sample is not None and int(sample) < n
+    if subsampled:
+        idx = _selection_subsample(values, status, censoring_type, int(sample), sample_random_state)
+        if censoring_type == 'interval':
+            sub_values, sub_status = (values[0][idx], values[1][idx]), None
+        else:
+            sub_values, sub_status = values[idx], status[idx]
+    else:
+        sub_values, sub_status = values, status
+
+    best_dist, _, reuse, scores = _select_ros_dist(sub_values, sub_status, censoring_type, plotting_position, turnbull_kwargs, **selection_kwargs)
+
+    valid = sorted((r2 for r2 in scores if r2 is not None), reverse=True)
+    selection = {
+        'selection_sample': int(sample) if subsampled else n,
+        'score_gap': valid[0] - valid[1] if len(valid) > 1 else np.nan,
+    }
+    return best_dist, ({} if subsampled else reuse), selection
+
+def _selection_subsample(values, status, censoring_type, size, random_state=0):
+    """
+    Stratified subsample for candidate scoring.
+
+    Observed values form one stratum; censored values are stratified by
+    direction and limit (interval rows by shape and censoring limit), so the
+    censored fraction and the detection-limit mix are kept. Rows are
+    allocated proportionally (largest remainders) and drawn at random within
+    each stratum.
+
+    Returns:
+        array: Sorted row indices.
+    """
+    if censoring_type == 'interval':
+        left, right = values
+        kind = np.select([left == right, np.isinf(right), np.isneginf(left) | (left <= 0)], [0, 1, 2], 3)
+        limit = np.select([kind == 1, kind == 2], [left, right], 0.0)
+    else:
+        kind = np.asarray(status, dtype=int)
+        limit = np.where(kind != 0, values, 0.0)
+
+    # Observed (kind 0) rows share stratum 0; only the censored rows are keyed
+    censored = kind != 0
+    codes = np.zeros(len(kind), dtype=np.intp)
+    if censored.any():
+        _, limit_code = np.unique(limit[censored], return_inverse=True)
+        limit_code = limit_code.ravel()
+        key = kind[censored] * (limit_code.max() + 1) + limit_code
+        codes[censored] = np.unique(key, return_inverse=True)[1].ravel() + 1
+    n = len(codes)
+
+    # Proportional allocation with largest remainders
+    counts = np.bincount(codes)
+    quota = counts * size / n
+    alloc = np.floor(quota).astype(int)
+    extra = size - alloc.sum()
+    alloc[np.argsort(-(quota - alloc), kind='stable')[:extra]] += 1
+
+    # Random order within each stratum; keep the first alloc[k] rows
+    rng = np.random.default_rng(random_state)
+    perm = rng.permutation(n)
+    order = perm[np.argsort(codes[perm], kind='stable')]
+    start = np.concatenate(([0], np.cumsum(counts)))
+    rank = np.arange(n) - start[codes[order]]
+    return np.sort(order[rank < alloc[codes[order]]])
+
+def _shared_stage(values, status, censoring_type, plotting_position, turnbull_kwargs):
+    """
+    Computes the distribution-free nonparametric stage used by every
+    candidate (None where there is none to share).
+    """
+    if censoring_type == 'interval':
+        return interval_npmle(values[0], values[1], **turnbull_kwargs)
+    if censoring_type in ['left', 'right'] and plotting_position in _KM_POSITIONS:
+        if censoring_type == 'left':
+            return km_positions(values, status)
+        return km_positions_right(values, status)
+    return None
+
+def _score_candidate(d, values, status, censoring_type, plotting_position, turnbull_kwargs, shared):
+    """
+    R^2 of one candidate distribution's ROS regression.
+
+    Returns:
+        tuple or None: (r_squared, reuse) or None if the candidate is invalid
+        or its fit failed.
+    """
+    try:
+        # Sanity check for lognormal: data must be positive
+        if d == 'lognormal':
+            if censoring_type in ['left', 'right'] and np.any(values <= 0):
+                return None
+            # For mixed, values might be < LOD. But if observed values are <= 0, lognormal is invalid.
+            if censoring_type == 'mixed' and np.any(values[status == 0] <= 0):
+                return None
+
+        if censoring_type == 'interval':
+            _, _, r2 = interval_ros_fit(shared[0], shared[1], d)
+            return r2, {'npmle': shared}
+
+        if censoring_type == 'mixed':
+            # Same fit and fallback as the explicit path; the fallback has no
+            # fit score, so the candidate cannot win.
+            npmle, (_, _, r2) = mixed_ros_fit(values, status, d, **turnbull_kwargs)
+            if npmle is None:
+                return None
+            return r2, {'npmle': npmle}
+
+        if shared is not None:
+            fit = ros_left_fit if censoring_type == 'left' else ros_right_fit
+            _, _, r2 = fit(values, status, dist=d, positions=shared)
+            return r2, {'positions': shared}
+
+        # Rank-based positions are cheap; score with the full fit.
+        impute_fn = impute_ros_left if censoring_type == 'left' else impute_ros_right
+        _, r2 = impute_fn(values, status, dist=d, plotting_position=plotting_position, return_fit=True)
+        return r2, {}
+
+    except Exception:
+        # Candidate failed (e.g. lognormal on negative data or regression failure)
+        return None
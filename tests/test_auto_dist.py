@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+import ndimpute.api as api
+from ndimpute.api import impute
+
+def _data(seed=0, n=300):
+    rng = np.random.default_rng(seed)
+    x = rng.lognormal(1, 0.8, n)
+    return rng, x
+
+def _cases(seed=0):
+    rng, x = _data(seed)
+    left_cens = x < 2.0
+    right_cens = x > 8.0
+    status = np.where(left_cens, -1, np.where(right_cens, 1, 0))
+    lower = np.floor(x)
+    bounds = np.column_stack([lower, lower + 1 + rng.integers(0, 2, len(x))])
+    return {
+        'left': (np.where(left_cens, 2.0, x), left_cens),
+        'right': (np.where(right_cens, 8.0, x), right_cens),
+        'mixed': (np.where(left_cens, 2.0, np.where(right_cens, 8.0, x)), status),
+        'interval': (bounds, None),
+    }
+
+@pytest.mark.parametrize('censoring_type', ['left', 'right', 'mixed', 'interval'])
+def test_auto_matches_explicit_winner(censoring_type):
+    values, status = _cases()[censoring_type]
+    df = impute(values, status, censoring_type=censoring_type, method='ros', dist='auto', random_state=4)
+    best = df.attrs['best_dist']
+
+    explicit = impute(values, status, censoring_type=censoring_type, method='ros', dist=best, random_state=4)
+    np.testing.assert_array_equal(df['imputed_value'].values, explicit['imputed_value'].values)
+
+    # Scores equal the standalone fits of each candidate.
+    other = 'normal' if best == 'lognormal' else 'lognormal'
+    if censoring_type == 'interval':
+        _, r2 = api.impute_interval_ros(values[:, 0], values[:, 1], dist=best, return_fit=True)
+        _, r2_other = api.impute_interval_ros(values[:, 0], values[:, 1], dist=other, return_fit=True)
+    elif censoring_type == 'mixed':
+        _, r2 = api.impute_ros_mixed_heuristic(values, status, dist=best, return_fit=True)
+        _, r2_other = api.impute_ros_mixed_heuristic(values, status, dist=other, return_fit=True)
+    else:
+        fn = api.impute_ros_left if censoring_type == 'left' else api.impute_ros_right
+        _, r2 = fn(values, status, dist=best, return_fit=True)
+        _, r2_other = fn(values, status, dist=other, return_fit=True)
+    assert df.attrs['fit_score'] == r2
+    assert r2 >= r2_other
+
+def test_auto_shares_nonparametric_stage(monkeypatch):
+    calls = {'npmle': 0, 'km': 0}
+    npmle, km = api.interval_npmle, api.km_positions
+
+    def counting_npmle(*args, **kwargs):
+        calls['npmle'] += 1
+        return npmle(*args, **kwargs)
+
+    def counting_km(*args, **kwargs):
+        calls['km'] += 1
+        return km(*args, **kwargs)
+
+    monkeypatch.setattr(api, 'interval_npmle', counting_npmle)
+    monkeypatch.setattr(api, 'km_positions', counting_km)
+
+    cases = _cases()
+    impute(cases['interval'][0], censoring_type='interval', method='ros', dist='auto')
+    assert calls['npmle'] == 1
+
+    impute(*cases['left'], censoring_type='left', method='ros', dist='auto')
+    assert calls['km'] == 1
+
+def test_auto_mixed_uses_interval_fallback(monkeypatch):
+    """
+    A candidate whose interval fit fails goes through the same legacy
+    fallback as the explicit path: it warns and, having no fit score, cannot
+    win the selection.
+    """
+    import ndimpute._ros_mixed as ros_mixed
+
+    values, status = _cases()['mixed']
+    assert impute(values, status, censoring_type='mixed', dist='auto').attrs['best_dist'] == 'lognormal'
+
+    npmle = ros_mixed.interval_npmle
+
+    def failing_lognormal(left, right, **kwargs):
+        # Lognormal bounds start at 0 for left-censored values
+        if np.min(left) == 0:
+            raise RuntimeError("no convergence")
+        return npmle(left, right, **kwargs)
+
+    monkeypatch.setattr(ros_mixed, 'interval_npmle', failing_lognormal)
+
+    with pytest.warns(UserWarning, match="Falling back"):
+        explicit = impute(values, status, censoring_type='mixed', dist='lognormal')
+    assert np.all(np.isfinite(explicit['imputed_value']))
+
+    with pytest.warns(UserWarning, match="Falling back"):
+        df = impute(values, status, censoring_type='mixed', dist='auto')
+    assert df.attrs['best_dist'] == 'normal'
+    _, r2, _, scores = api._select_ros_dist(values, status, 'mixed', None, {})
+    assert scores == [None, r2]
+
+@pytest.mark.parametrize('censoring_type', ['left', 'mixed', 'interval'])
+def test_parallel_selection_matches_serial(censoring_type):
+    values, status = _cases(1)[censoring_type]
+    serial = impute(values, status, censoring_type=censoring_type, method='ros', dist='auto', random_state=2)
+
+    for backend in ['thread', 'process']:
+        parallel = impute(values, status, censoring_type=censoring_type, method='ros', dist='auto',
+                          random_state=2, n_jobs=2, backend=backend)
+        np.testing.assert_array_equal(parallel['imputed_value'].values, serial['imputed_value'].values)
+        assert parallel.attrs['best_dist'] == serial.attrs['best_dist']
+        assert parallel.attrs['fit_score'] == serial.attrs['fit_score']
+
+def test_candidate_ties_and_backend(monkeypatch):
+    values, status = _cases()['left']
+
+    # Ties go to the earlier candidate, also in parallel.
+    monkeypatch.setattr(api, '_AUTO_CANDIDATES', ('normal', 'normal'))
+    best, r2, _, scores = api._select_ros_dist(values, status, 'left', 'kaplan-meier', {}, n_jobs=2)
+    assert best == 'normal'
+    assert scores[0] == scores[1] == r2
+
+    with pytest.raises(ValueError, match="backend"):
+        impute(values, status, censoring_type='left', dist='auto', n_jobs=2, backend='gpu')
+
+@pytest.mark.parametrize('censoring_type', ['left', 'right', 'mixed', 'interval'])
+def test_selection_subsample(censoring_type):
+    values, status = _cases(1)[censoring_type]
+    full = impute(values, status, censoring_type=censoring_type, dist='auto', random_state=2)
+    assert full.attrs['selection_sample'] == len(values)
+    assert full.attrs['score_gap'] >= 0
+
+    df = impute(values, status, censoring_type=censoring_type, dist='auto', random_state=2, selection_sample=120)
+    assert df.attrs['selection_sample'] == 120
+    assert df.attrs['score_gap'] >= 0
+
+    # Only the winner runs on the full data, and its score is the full fit.
+    explicit = impute(values, status, censoring_type=censoring_type, dist=df.attrs['best_dist'], random_state=2)
+    np.testing.assert_array_equal(df['imputed_value'].values, explicit['imputed_value'].values)
+    if df.attrs['best_dist'] == full.attrs['best_dist']:
+        assert df.attrs['fit_score'] == pytest.approx(full.attrs['fit_score'])
+
+def test_selection_subsample_is_stratified():
+    rng = np.random.default_rng(5)
+    n = 5000
+    values = rng.lognormal(1, 1, n)
+    limit = rng.choice([0.5, 1.0, 3.0], n, p=[0.5, 0.3, 0.2])
+    status = values < limit
+    values = np.where(status, limit, values)
+
+    idx = api._selection_subsample(values, status, 'left', 500)
+    assert len(idx) == 500 and len(np.unique(idx)) == 500
+    assert abs(status[idx].mean() - status.mean()) < 2 / 500
+    for lim in [0.5, 1.0, 3.0]:
+        share = np.mean(status & (values == lim))
+        assert abs(np.mean(status[idx] & (values[idx] == lim)) - share) < 2 / 500
+
+    # 'auto' keeps small data whole.
+    df = impute(values, status, censoring_type='left', dist='auto', selection_sample='auto')
+    assert df.attrs['selection_sample'] == n
+    with pytest.raises(ValueError, match="selection_sample"):
+        impute(values, status, censoring_type='left', dist='auto', selection_sample=1)
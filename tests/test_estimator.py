@@ -0,0 +1,102 @@
+import pickle
+import numpy as np
+import pytest
+from ndimpute import CensoredImputer, impute, plotting_positions
+
+def _left_data(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.lognormal(1, 1, n)
+    lod = rng.choice([1.0, 2.0, 3.0], n)
+    censored = x < lod
+    return np.where(censored, lod, x), censored
+
+@pytest.mark.parametrize("censoring_type", ['left', 'right'])
+@pytest.mark.parametrize("dist", ['lognormal', 'normal'])
+@pytest.mark.parametrize("impute_type", ['mean', 'stochastic'])
+def test_fit_transform_matches_impute(censoring_type, dist, impute_type):
+    values, censored = _left_data()
+    imputer = CensoredImputer(dist=dist, censoring_type=censoring_type, impute_type=impute_type, random_state=1)
+    expected = impute(values, censored, censoring_type=censoring_type, dist=dist, impute_type=impute_type, random_state=1)
+
+    np.testing.assert_array_equal(imputer.fit_transform(values, censored), expected['imputed_value'])
+
+def test_fit_transform_matches_impute_mixed_interval_parametric():
+    values, censored = _left_data(seed=1)
+    rng = np.random.default_rng(1)
+    status = np.where(censored, -1, np.where(rng.uniform(size=len(values)) < 0.1, 1, 0))
+
+    cases = [
+        (dict(censoring_type='mixed', random_state=2), (values, status)),
+        (dict(censoring_type='interval', random_state=2), (np.column_stack((np.floor(values), np.ceil(values))), None)),
+        (dict(method='parametric', dist='weibull', censoring_type='mixed'), (values, status)),
+    ]
+    for params, (x, s) in cases:
+        expected = impute(x, s, **params)['imputed_value']
+        np.testing.assert_array_equal(CensoredImputer(**params).fit_transform(x, s), expected)
+
+def test_fitted_artifacts_and_new_batch():
+    values, censored = _left_data(seed=2)
+    imputer = CensoredImputer(censoring_type='left', impute_type='mean').fit(values, censored)
+
+    assert imputer.slope_ > 0
+    assert 0 < imputer.r_squared_ <= 1
+    assert imputer.n_samples_fit_ == len(values)
+    for fitted, expected in zip(imputer.positions_, plotting_positions(values, censored)):
+        np.testing.assert_array_equal(fitted, expected)
+
+    # New batch: observed values untouched, censored values below their limit
+    new_values, new_censored = _left_data(n=50, seed=3)
+    imputed = imputer.transform(new_values, new_censored)
+    np.testing.assert_array_equal(imputed[~new_censored], new_values[~new_censored])
+    assert np.all(imputed[new_censored] <= new_values[new_censored])
+
+    # Parametric: the fitted parameters are those reported by impute()
+    df = impute(values, censored, method='parametric', censoring_type='right')
+    imputer = CensoredImputer(method='parametric', censoring_type='right').fit(values, censored)
+    assert imputer.params_ == df.attrs['params']
+
+def test_params_and_pickle():
+    imputer = CensoredImputer(dist='normal', censoring_type='right')
+    assert imputer.get_params()['dist'] == 'normal'
+    assert imputer.set_params(impute_type='mean') is imputer
+    assert imputer.impute_type == 'mean'
+    with pytest.raises(ValueError):
+        imputer.set_params(bogus=1)
+    with pytest.raises(ValueError):
+        imputer.transform([1.0, 2.0], [False, True])
+
+    values, censored = _left_data(seed=4)
+    imputer.fit(values, censored)
+    restored = pickle.loads(pickle.dumps(imputer))
+    np.testing.assert_array_equal(restored.transform(values, censored), imputer.transform(values, censored))
+
+    with pytest.raises(ValueError):
+        CensoredImputer(plotting_position='simple').fit(values, censored)
+
+def test_unsupported_combinations_match_impute():
+    values, censored = _left_data(seed=5)
+    with pytest.raises(NotImplementedError):
+        impute(values, censored, method='parametric', censoring_type='left')
+    with pytest.raises(NotImplementedError):
+        CensoredImputer(method='parametric', censoring_type='left').fit(values, censored)
+
+def test_mixed_fallback_matches_impute(monkeypatch):
+    """A failed interval fit falls back to the legacy heuristic, as in impute()."""
+    import ndimpute._ros_mixed as ros_mixed
+
+    def failing_npmle(*args, **kwargs):
+        raise RuntimeError("no convergence")
+
+    monkeypatch.setattr(ros_mixed, 'interval_npmle', failing_npmle)
+
+    values, censored = _left_data(seed=6)
+    status = np.where(censored, -1, np.where(values > 8.0, 1, 0))
+    with pytest.warns(UserWarning, match="Falling back"):
+        expected = impute(values, status, censoring_type='mixed', random_state=3)['imputed_value']
+    imputer = CensoredImputer(censoring_type='mixed', random_state=3)
+    with pytest.warns(UserWarning, match="Falling back"):
+        imputed = imputer.fit_transform(values, status)
+
+    assert imputer.fallback_
+    assert np.isnan(imputer.r_squared_)
+    np.testing.assert_array_equal(imputed, expected)
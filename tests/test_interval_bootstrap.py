@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from ndimpute import bootstrap_interval_ros
+from ndimpute._turnbull import turnbull_em, turnbull_em_batch, collapse_intervals, _equivalence_intervals, _log_likelihood
+from ndimpute._interval import impute_interval_ros_grouped
+
+def _make_intervals(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.lognormal(1, 0.7, n)
+    left = np.floor(x)
+    right = left + 1 + rng.integers(0, 2, n)
+    right[rng.uniform(size=n) < 0.05] = np.inf
+    return left, right
+
+def test_batch_turnbull_matches_single_fits():
+    """
+    Every weighted problem of the batched EM reaches the likelihood of an
+    independent Turnbull fit on the same weights.
+    """
+    left, right = _make_intervals()
+    left_u, right_u, counts, _ = collapse_intervals(left, right)
+    rng = np.random.default_rng(1)
+    weights = rng.multinomial(len(left), counts / len(left), size=5).astype(float)
+
+    intervals, probs, iterations = turnbull_em_batch(left_u, right_u, weights, tol=1e-10, max_iter=100000)
+    assert probs.shape == (5, len(intervals))
+    np.testing.assert_allclose(probs.sum(axis=1), 1.0)
+    assert np.all(iterations < 100000)
+
+    endpoints = np.unique(np.concatenate([left_u, right_u]))
+    _, first, last = _equivalence_intervals(left_u, right_u, endpoints[np.isfinite(endpoints)])
+
+    for b in range(5):
+        keep = weights[b] > 0
+        iv, p = turnbull_em(left_u[keep], right_u[keep], weights=weights[b, keep], tol=1e-10, max_iter=100000)
+        ep = np.unique(np.concatenate([left_u[keep], right_u[keep]]))
+        _, f, l = _equivalence_intervals(left_u[keep], right_u[keep], ep[np.isfinite(ep)])
+
+        ll_batch = _log_likelihood(probs[b], first, last, weights[b])
+        ll_single = _log_likelihood(p, f, l, weights[b, keep])
+        assert ll_batch == pytest.approx(ll_single, abs=1e-6)
+
+def test_bootstrap_interval_ros():
+    left, right = _make_intervals()
+    summary, samples = bootstrap_interval_ros(left, right, n_boot=100, random_state=0, return_samples=True)
+
+    assert list(summary.index) == ['intercept', 'slope', 'mean', 'median', 'std']
+    assert list(summary.columns) == ['estimate', 'lower', 'upper']
+    assert samples.shape == (100, 5)
+    assert np.all(summary['lower'] <= summary['upper'])
+
+    # The estimate is the ordinary Interval ROS fit on the original data.
+    _, fits, _ = impute_interval_ros_grouped(left, right, np.zeros(len(left)), return_fit=True)
+    assert summary.loc['intercept', 'estimate'] == pytest.approx(fits['intercept'].iloc[0], rel=1e-3)
+    assert summary.loc['slope', 'estimate'] == pytest.approx(fits['slope'].iloc[0], rel=1e-3)
+    assert summary.loc['median', 'estimate'] == pytest.approx(np.exp(fits['intercept'].iloc[0]), rel=1e-3)
+
+    # The intervals bracket the point estimates.
+    assert np.all(summary['lower'] < summary['estimate'])
+    assert np.all(summary['estimate'] < summary['upper'])
+
+    # Reproducible with a seed.
+    again = bootstrap_interval_ros(left, right, n_boot=100, random_state=0)
+    np.testing.assert_array_equal(summary.values, again.values)
+
+    normal = bootstrap_interval_ros(left, right, n_boot=20, dist='normal', random_state=0)
+    assert normal.loc['mean', 'estimate'] == normal.loc['intercept', 'estimate']
+
+    with pytest.raises(ValueError):
+        bootstrap_interval_ros(left, right, dist='weibull')
+    with pytest.raises(ValueError):
+        bootstrap_interval_ros(left, right, ci=1.5)
@@ -143,5 +143,119 @@ class TestParametricImputation(unittest.TestCase):
         with self.assertRaises(ValueError):
              impute(values_neg, status_neg, method='parametric', censoring_type='mixed')
 
+    def test_censored_normal_newton_fit(self):
+        """The Newton MLE reaches at least scipy's likelihood and agrees with its estimates."""
+        from scipy.stats import CensoredData
+        from ndimpute._parametric import fit_censored_normal
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(2.0, 1.5, 2000)
+        lod = rng.choice([1.0, 1.5], 2000)
+        observed = x[(x >= lod) & (x <= 4.0)]
+        left = lod[x < lod]
+        right = np.full(np.sum(x > 4.0), 4.0)
+
+        def loglik(mu, sigma):
+            return (norm.logpdf(observed, mu, sigma).sum() + norm.logcdf(left, mu, sigma).sum()
+                    + norm.logsf(right, mu, sigma).sum())
+
+        mu, sigma = fit_censored_normal(observed, left, right)
+        mu_ref, sigma_ref = norm.fit(CensoredData(uncensored=observed, left=left, right=right))
+
+        self.assertGreaterEqual(loglik(mu, sigma), loglik(mu_ref, sigma_ref) - 1e-9)
+        self.assertAlmostEqual(mu, mu_ref, delta=1e-3)
+        self.assertAlmostEqual(sigma, sigma_ref, delta=1e-3)
+
+        # Uncensored data: the sample mean and (biased) standard deviation
+        mu, sigma = fit_censored_normal(observed)
+        self.assertAlmostEqual(mu, observed.mean(), places=10)
+        self.assertAlmostEqual(sigma, observed.std(), places=10)
+
+    def test_censored_weibull_fit(self):
+        """Profile (exact/right) and Newton (with left) Weibull fits match or beat scipy's likelihood."""
+        from scipy.stats import CensoredData
+        from ndimpute._parametric import fit_censored_weibull
+
+        rng = np.random.default_rng(1)
+        x = weibull_min.rvs(1.7, scale=3.0, size=2000, random_state=rng)
+        lod = rng.choice([0.8, 1.2], 2000)
+        limit = rng.choice([5.0, 6.0], 2000)
+
+        def loglik(shape, scale, observed, left, right):
+            return (weibull_min.logpdf(observed, shape, scale=scale).sum()
+                    + weibull_min.logcdf(left, shape, scale=scale).sum()
+                    + weibull_min.logsf(right, shape, scale=scale).sum())
+
+        for with_left, method in [(False, 'profile'), (True, 'newton')]:
+            low = lod if with_left else np.zeros(2000)
+            observed, left, right = x[(x >= low) & (x <= limit)], low[x < low], limit[x > limit]
+
+            shape, scale, diag = fit_censored_weibull(observed, left, right, return_diagnostics=True)
+            ref_shape, _, ref_scale = weibull_min.fit(CensoredData(uncensored=observed, left=left, right=right), floc=0)
+
+            self.assertEqual(diag['method'], method)
+            self.assertTrue(diag['converged'])
+            self.assertAlmostEqual(diag['log_likelihood'], loglik(shape, scale, observed, left, right), places=8)
+            self.assertGreaterEqual(diag['log_likelihood'], loglik(ref_shape, ref_scale, observed, left, right) - 1e-9)
+            self.assertAlmostEqual(shape, ref_shape, delta=1e-3)
+            self.assertAlmostEqual(scale, ref_scale, delta=1e-3)
+
+        with self.assertRaises(ValueError):
+            fit_censored_weibull([1.0, -2.0])
+
+    def test_params_warm_start_and_reuse(self):
+        """Fitted parameters can be returned, used as a warm start, or applied without fitting."""
+        from ndimpute._parametric import impute_mixed_parametric, impute_right_conditional
+
+        rng = np.random.default_rng(2)
+        x = rng.lognormal(1.0, 0.8, 1000)
+        status = np.where(x < 1.5, -1, np.where(x > 10, 1, 0))
+        values = np.where(status == -1, 1.5, np.where(status == 1, 10.0, x))
+
+        for dist in ['lognormal', 'normal', 'weibull']:
+            imputed, params = impute_mixed_parametric(values, status, dist=dist, return_params=True)
+            self.assertEqual(params['dist'], dist)
+
+            warm, warm_params = impute_mixed_parametric(values, status, dist=dist, return_params=True, init_params=params)
+            np.testing.assert_allclose(warm, imputed, rtol=1e-8)
+
+            # Known parameters skip the fit; dicts and tuples are equivalent
+            names = ('shape', 'scale') if dist == 'weibull' else ('mu', 'sigma')
+            np.testing.assert_array_equal(impute_mixed_parametric(values, status, dist=dist, params=params), imputed)
+            np.testing.assert_array_equal(
+                impute_mixed_parametric(values, status, dist=dist, params=tuple(params[k] for k in names)), imputed)
+
+        # Parameters from a reference batch applied to a new one
+        _, params = impute_right_conditional(values, status == 1, dist='lognormal', return_params=True)
+        batch = np.array([2.0, 10.0, 3.0, 10.0])
+        df = impute(batch, [False, True, False, True], method='parametric', censoring_type='right', params=params)
+        self.assertEqual(df.attrs['params'], params)
+        self.assertTrue(np.all(df['imputed_value'][[1, 3]] > 10.0))
+
+        # Nothing censored: data passes through unchanged, and the supplied
+        # parameters (or else the fit on the observed values) are returned
+        uncensored = np.array([2.0, 3.0, 5.0, 8.0])
+        for dist in ['lognormal', 'normal', 'weibull']:
+            imputed, fitted = impute_right_conditional(uncensored, [False] * 4, dist=dist, return_params=True)
+            np.testing.assert_array_equal(imputed, uncensored)
+            _, expected = impute_mixed_parametric(uncensored, np.zeros(4, dtype=int), dist=dist, return_params=True)
+            self.assertEqual(fitted, expected)
+        _, reused = impute_right_conditional(uncensored, [False] * 4, dist='lognormal', params=params, return_params=True)
+        self.assertEqual(reused, params)
+        _, reused = impute_right_conditional(uncensored, [False] * 4, dist='lognormal', params=(1.0, 0.5), return_params=True)
+        self.assertEqual(reused, {'dist': 'lognormal', 'mu': 1.0, 'sigma': 0.5})
+
+        # ... unless the observed values admit no fit
+        for dist in ['lognormal', 'weibull']:
+            df = impute([0.0, 1.0, 2.0], [False] * 3, censoring_type='right', method='parametric', dist=dist)
+            np.testing.assert_array_equal(df['imputed_value'], [0.0, 1.0, 2.0])
+            self.assertNotIn('params', df.attrs)
+        self.assertIsNone(impute_right_conditional([2.0, 2.0], [False] * 2, dist='normal', return_params=True)[1])
+
+        with self.assertRaises(ValueError):
+            impute_mixed_parametric(values, status, dist='weibull', params=params)
+        with self.assertRaises(ValueError):
+            impute_mixed_parametric(values, status, dist='normal', params=(0.0, -1.0))
+
 if __name__ == '__main__':
     unittest.main()
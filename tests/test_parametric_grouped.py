@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from ndimpute.api import impute
+from ndimpute._parametric import impute_parametric_grouped, impute_mixed_parametric
+
+def _make_groups(n_groups=40, size=30, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = np.repeat(np.arange(n_groups), size)
+    x = rng.lognormal(rng.normal(1, 0.3, n_groups)[groups], rng.uniform(0.5, 1.2, n_groups)[groups])
+    lod = rng.choice([1.0, 2.0], len(x))
+    limit = rng.choice([8.0, 12.0], len(x))
+    status = np.where(x < lod, -1, np.where(x > limit, 1, 0))
+    values = np.where(status == -1, lod, np.where(status == 1, limit, x))
+    return values, status, groups
+
+@pytest.mark.parametrize('dist', ['lognormal', 'normal', 'weibull'])
+def test_grouped_parametric_matches_per_group(dist):
+    """
+    The batched solve must reproduce an independent parametric fit per group.
+    """
+    values, status, groups = _make_groups()
+    imputed, fits = impute_parametric_grouped(values, status, groups, dist=dist, return_fit=True)
+
+    assert fits['converged'].all()
+    assert list(fits.columns[:2]) == (['shape', 'scale'] if dist == 'weibull' else ['mu', 'sigma'])
+    np.testing.assert_array_equal(fits['n'], 30)
+
+    for gid in fits.index:
+        mask = groups == gid
+        expected = impute_mixed_parametric(values[mask], status[mask], dist=dist)
+        np.testing.assert_allclose(imputed[mask], expected, rtol=1e-6)
+
+def test_grouped_parametric_api():
+    values, status, groups = _make_groups(seed=1)
+    df = impute(values, status, method='parametric', censoring_type='mixed', groups=groups,
+                impute_type='stochastic', random_state=0)
+
+    np.testing.assert_array_equal(df['group'], groups)
+    assert len(df.attrs['group_fits']) == 40
+    assert np.all(df.loc[status == -1, 'imputed_value'] <= values[status == -1])
+    assert np.all(df.loc[status == 1, 'imputed_value'] >= values[status == 1])
+
+    # Right censoring with boolean status
+    right = status == 1
+    df = impute(values, right, method='parametric', censoring_type='right', groups=groups)
+    assert np.all(df.loc[right, 'imputed_value'] >= values[right])
+
+    with pytest.raises(ValueError, match="groups"):
+        impute(values, status, method='substitution', censoring_type='mixed', groups=groups)
+
+def test_grouped_parametric_fallback_and_failed_group():
+    values, status, groups = _make_groups(n_groups=3, seed=2)
+
+    # No observed values: refit by the single-group fallback
+    status[groups == 1] = 1
+    imputed, fits = impute_parametric_grouped(values, status, groups, return_fit=True)
+    assert not fits.loc[1, 'converged']
+    np.testing.assert_allclose(imputed[groups == 1], impute_mixed_parametric(values[groups == 1], status[groups == 1]))
+
+    # No spread at all: the fit fails with a warning; observed values are kept
+    values[groups == 2] = 2.5
+    status[groups == 2] = 0
+    with pytest.warns(UserWarning, match="1 group"):
+        imputed, fits = impute_parametric_grouped(values, status, groups, return_fit=True)
+
+    assert np.isnan(fits.loc[2, 'mu'])
+    assert np.all(imputed[groups == 2] == 2.5)
+    assert np.all(np.isfinite(imputed))
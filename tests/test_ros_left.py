@@ -58,5 +58,87 @@ class TestROSLeft(unittest.TestCase):
         with self.assertRaises(ValueError):
             impute_ros_left(values, status)
 
+    def test_quantile_spacing_matches_per_limit_loop(self):
+        # Many distinct reporting limits; the one-pass spacing must reproduce
+        # spacing each limit's censored values on their own.
+        from scipy.stats import norm
+        from ndimpute._ros_left import km_positions, ros_left_fit
+
+        rng = np.random.default_rng(7)
+        x = rng.lognormal(1, 1, 2000)
+        limits = np.round(rng.lognormal(0.5, 0.5, 2000), 1)
+        status = x < limits
+        values = np.where(status, limits, x)
+
+        for dist in ['lognormal', 'normal']:
+            result = impute_ros_left(values, status, dist=dist)
+
+            slope, intercept, _ = ros_left_fit(values, status, dist=dist)
+            pp_limits = km_positions(values, status)[1]
+            y_cens = values[status]
+            z = np.zeros(len(y_cens))
+            for lim in np.unique(y_cens):
+                idxs = np.where(y_cens == lim)[0]
+                p_sub = (np.arange(1, len(idxs) + 1) / (len(idxs) + 1)) * pp_limits[idxs[0]]
+                z[idxs] = norm.ppf(p_sub)
+            expected = intercept + slope * z
+            if dist == 'lognormal':
+                expected = np.exp(expected)
+
+            np.testing.assert_array_equal(result[status], np.minimum(expected, y_cens))
+            np.testing.assert_array_equal(result[~status], values[~status])
+
+    def test_simple_positions_match_pandas_ranking(self):
+        # Ties between censored and uncensored values rank as pandas
+        # sort_values orders them.
+        from scipy.stats import norm, linregress
+
+        rng = np.random.default_rng(3)
+        values = np.round(rng.lognormal(1, 1, 500), 1)
+        status = values < 2.0
+        values[status] = 2.0
+
+        for dist in ['lognormal', 'normal']:
+            result, r2 = impute_ros_left(values, status, dist=dist, plotting_position='simple', return_fit=True)
+
+            df = pd.DataFrame({'val': values, 'cens': status}).sort_values('val')
+            df['z'] = norm.ppf(np.arange(1, len(df) + 1) / (len(df) + 1))
+            y = df.loc[~df['cens'], 'val']
+            if dist == 'lognormal':
+                y = np.log(y)
+            fit = linregress(df.loc[~df['cens'], 'z'], y)
+            pred = fit.intercept + fit.slope * df.loc[df['cens'], 'z']
+            if dist == 'lognormal':
+                pred = np.exp(pred)
+            expected = values.copy()
+            expected[df.index[df['cens']]] = np.minimum(pred, 2.0)
+
+            np.testing.assert_array_equal(result, expected)
+            self.assertEqual(r2, fit.rvalue**2)
+
+    def test_plotting_positions_match_scipy_ecdf(self):
+        from scipy.stats import ecdf, CensoredData
+        from ndimpute import plotting_positions
+
+        rng = np.random.default_rng(11)
+        x = np.round(rng.lognormal(1, 1, 1000), 1)
+        limits = np.round(rng.lognormal(1, 0.5, 1000), 0)
+        status = x < limits
+        values = np.where(status, limits, x)
+        n = len(values)
+
+        res = ecdf(CensoredData(uncensored=-values[~status], right=-values[status]))
+        pp_unc, pp_limits = plotting_positions(values, status)
+        np.testing.assert_array_equal(pp_unc, res.sf.evaluate(-values[~status]) * (n / (n + 1)))
+        np.testing.assert_array_equal(pp_limits, res.sf.evaluate(-values[status]) * (n / (n + 1)))
+
+        # Right censoring gives the positions of the reversed problem.
+        right = plotting_positions(-values, status, censoring='right')
+        np.testing.assert_array_equal(right[0], pp_unc)
+        np.testing.assert_array_equal(right[1], pp_limits)
+
+        with self.assertRaises(ValueError):
+            plotting_positions(values, status, censoring='interval')
+
 if __name__ == '__main__':
     unittest.main()
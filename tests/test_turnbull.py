@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
-from ndimpute._turnbull import turnbull_em, predict_turnbull
+from ndimpute._turnbull import turnbull_em, predict_turnbull, collapse_intervals, coarsen_intervals, TurnbullCurve, _equivalence_intervals, _log_likelihood, _kkt_gradient, _self_consistency, _doubly_censored_em, _is_doubly_censored
+from ndimpute.api import impute
 
 class TestTurnbull(unittest.TestCase):
     def test_turnbull_basic(self):
@@ -26,6 +27,363 @@ class TestTurnbull(unittest.TestCase):
                 has_2 = True
         self.assertTrue(has_2)
 
+    def test_turnbull_matches_dense_em(self):
+        # The prefix-sum engine must reproduce the textbook dense-matrix EM.
+        rng = np.random.default_rng(0)
+        left = rng.integers(0, 10, 60).astype(float)
+        right = left + rng.integers(0, 4, 60)
+        right[:5] = np.inf
+        left[5:10] = -np.inf
+
+        intervals, probs = turnbull_em(left, right, tol=1e-12)
+
+        starts, ends = intervals[:, 0], intervals[:, 1]
+        single = (starts == ends)
+        alpha = np.where(
+            single[None, :],
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= starts[None, :]),
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= ends[None, :])
+        ).astype(float)
+
+        p = np.ones(len(intervals)) / len(intervals)
+        for _ in range(1000):
+            contrib = alpha * p[None, :] / (alpha @ p)[:, None]
+            p = contrib.sum(axis=0) / len(left)
+
+        np.testing.assert_allclose(probs, p, atol=1e-9)
+
+    def test_rows_without_support_count_towards_n(self):
+        # Rows covering no candidate (L > R, e.g. a lognormal left limit <= 0
+        # mapped to (0, L]) keep the dense EM normalisation by n: the masses
+        # sum to the supported fraction.
+        from ndimpute._turnbull import turnbull_em_grouped, turnbull_em_batch
+
+        left = np.array([0.0, 1.0, 2.0, 1.0, 3.0, 0.0])
+        right = np.array([2.0, 3.0, 2.0, 4.0, np.inf, -1.0])
+
+        intervals, probs = turnbull_em(left, right, tol=1e-12)
+        self.assertAlmostEqual(np.sum(probs), 5 / 6)
+
+        starts, ends = intervals[:, 0], intervals[:, 1]
+        single = (starts == ends)
+        alpha = np.where(
+            single[None, :],
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= starts[None, :]),
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= ends[None, :])
+        ).astype(float)
+        p = np.ones(len(intervals)) / len(intervals)
+        for _ in range(2000):
+            denom = alpha @ p
+            denom[denom == 0] = 1e-100
+            p = (alpha * p[None, :] / denom[:, None]).sum(axis=0) / len(left)
+        np.testing.assert_allclose(probs, p, atol=1e-9)
+
+        _, grouped, _, _ = turnbull_em_grouped(left, right, np.zeros(len(left)), tol=1e-12)
+        np.testing.assert_allclose(grouped, p, atol=1e-9)
+        _, batched, _ = turnbull_em_batch(left, right, np.ones((1, len(left))), tol=1e-12)
+        np.testing.assert_allclose(batched[0], p, atol=1e-9)
+
+    def test_equivalence_intervals_sweep(self):
+        # Each row's [first, last] range must be exactly the set of candidates
+        # it covers, and every retained candidate must be covered by some row.
+        rng = np.random.default_rng(1)
+        left = rng.integers(0, 8, 40).astype(float)
+        right = left + rng.integers(0, 3, 40)
+        left[:3] = -np.inf
+        right[3:6] = np.inf
+
+        endpoints = np.unique(np.concatenate([left, right]))
+        endpoints = endpoints[np.isfinite(endpoints)]
+        intervals, first, last = _equivalence_intervals(left, right, endpoints)
+
+        starts, ends = intervals[:, 0], intervals[:, 1]
+        single = (starts == ends)
+        covered = np.where(
+            single[None, :],
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= starts[None, :]),
+            (left[:, None] <= starts[None, :]) & (right[:, None] >= ends[None, :])
+        )
+        cols = np.arange(len(intervals))
+        expected = (cols[None, :] >= first[:, None]) & (cols[None, :] <= last[:, None])
+
+        np.testing.assert_array_equal(covered, expected)
+        self.assertTrue(np.all(covered.any(axis=0)))
+
+    def test_accelerators_reach_em_fixed_point(self):
+        rng = np.random.default_rng(2)
+        x = rng.lognormal(1, 1, 300)
+        width = rng.uniform(0.5, 6, 300)
+        left = np.round(np.maximum(x - width * rng.uniform(size=300), 0), 1)
+        right = np.round(left + width, 1)
+
+        intervals, p_ref = turnbull_em(left, right, max_iter=20000, tol=1e-9)
+        endpoints = np.unique(np.concatenate([left, right]))
+        _, first, last = _equivalence_intervals(left, right, endpoints)
+        w = np.ones(len(left))
+        ll_ref = _log_likelihood(p_ref, first, last, w)
+
+        for acc in ['squarem', 'aitken']:
+            iv, p, diag = turnbull_em(left, right, max_iter=20000, tol=1e-9, accelerator=acc, return_diagnostics=True)
+            # Plain EM does not reach this tolerance within 20000 iterations
+            self.assertTrue(diag['converged'])
+            self.assertLess(diag['iterations'], 2500)
+            np.testing.assert_array_equal(iv, intervals)
+            self.assertAlmostEqual(np.sum(p), 1.0)
+            self.assertTrue(np.all(p >= 0))
+            self.assertAlmostEqual(_log_likelihood(p, first, last, w), ll_ref, delta=1e-3)
+
+        with self.assertRaises(ValueError):
+            turnbull_em(left, right, accelerator='newton')
+
+        df = impute(np.column_stack((left, right)), censoring_type='interval',
+                    accelerator='squarem', random_state=0)
+        self.assertTrue(np.all(df['imputed_value'] >= left))
+        self.assertTrue(np.all(df['imputed_value'] <= right))
+
+    def test_em_icm_satisfies_kkt(self):
+        rng = np.random.default_rng(3)
+        x = rng.lognormal(1, 1, 500)
+        width = rng.uniform(0.5, 8, 500)
+        left = np.round(np.maximum(x - width * rng.uniform(size=500), 0), 1)
+        right = np.round(left + width, 1)
+
+        endpoints = np.unique(np.concatenate([left, right]))
+        _, first, last = _equivalence_intervals(left, right, endpoints)
+        w = np.ones(len(left))
+
+        _, p_em = turnbull_em(left, right)
+        _, p_icm = turnbull_em(left, right, solver='em-icm', tol=1e-8)
+
+        # Optimality certificate: normalised gradient is <= 1 everywhere.
+        self.assertLessEqual(np.max(_kkt_gradient(p_icm, first, last, w)), 1.0 + 1e-8)
+        self.assertAlmostEqual(np.sum(p_icm), 1.0)
+        self.assertGreaterEqual(_log_likelihood(p_icm, first, last, w),
+                                _log_likelihood(p_em, first, last, w) - 1e-9)
+
+        with self.assertRaises(ValueError):
+            turnbull_em(left, right, solver='icm-only')
+        with self.assertRaises(ValueError):
+            turnbull_em(left, right, solver='em-icm', accelerator='squarem')
+
+    def test_active_set_pruning(self):
+        rng = np.random.default_rng(4)
+        x = rng.lognormal(1, 1, 2000)
+        width = rng.uniform(0.5, 8, 2000)
+        left = np.round(np.maximum(x - width * rng.uniform(size=2000), 0), 2)
+        right = np.round(left + width, 2)
+
+        endpoints = np.unique(np.concatenate([left, right]))
+        _, first, last = _equivalence_intervals(left, right, endpoints)
+        w = np.ones(len(left))
+
+        _, p_full = turnbull_em(left, right, solver='em-icm', tol=1e-8)
+        _, p_pruned = turnbull_em(left, right, solver='em-icm', tol=1e-8, prune_tol=1e-10)
+
+        # The final full pass certifies the pruned solution on all columns.
+        self.assertLessEqual(np.max(_kkt_gradient(p_pruned, first, last, w)), 1.0 + 1e-8)
+        self.assertAlmostEqual(np.sum(p_pruned), 1.0)
+        self.assertAlmostEqual(_log_likelihood(p_pruned, first, last, w),
+                               _log_likelihood(p_full, first, last, w), places=6)
+
+        _, p_em = turnbull_em(left, right, accelerator='squarem', prune_tol=1e-10)
+        self.assertEqual(len(p_em), len(p_full))
+        self.assertAlmostEqual(np.sum(p_em), 1.0)
+
+    def test_duplicate_rows_are_collapsed(self):
+        # Fixed inspection schedules produce many identical rows.
+        left = np.array([0, 2, 2, 4, 0, 2, 6, 6, 6, 3.5])
+        right = np.array([2, 4, 4, 6, 2, 4, 8, 8, 8, 3.5])
+
+        left_u, right_u, counts, inverse = collapse_intervals(left, right)
+        self.assertEqual(len(left_u), 5)
+        np.testing.assert_array_equal(left_u[inverse], left)
+        np.testing.assert_array_equal(right_u[inverse], right)
+        self.assertEqual(np.sum(counts), len(left))
+
+        iv_full, p_full = turnbull_em(left, right, tol=1e-10)
+        iv_w, p_w = turnbull_em(left_u, right_u, weights=counts, tol=1e-10)
+        np.testing.assert_array_equal(iv_full, iv_w)
+        np.testing.assert_allclose(p_full, p_w, atol=1e-12)
+
+        # Identical intervals get identical conditional means.
+        df = impute(np.column_stack((left, right)), censoring_type='interval', impute_type='mean')
+        imputed = df['imputed_value'].values
+        self.assertEqual(imputed[1], imputed[2])
+        self.assertEqual(imputed[6], imputed[8])
+
+    def test_warm_start(self):
+        rng = np.random.default_rng(5)
+        x = rng.lognormal(1, 1, 400)
+        width = rng.uniform(0.5, 6, 400)
+        left = np.round(np.maximum(x - width * rng.uniform(size=400), 0), 1)
+        right = np.round(left + width, 1)
+
+        prev = turnbull_em(left[:-10], right[:-10], tol=1e-9, max_iter=20000)
+        intervals, p_cold = turnbull_em(left, right, tol=1e-9, max_iter=20000)
+        iv_warm, p_warm = turnbull_em(left, right, tol=1e-9, max_iter=20000, warm_start=prev)
+
+        np.testing.assert_array_equal(iv_warm, intervals)
+        np.testing.assert_allclose(np.cumsum(p_warm), np.cumsum(p_cold), atol=1e-3)
+
+        # Restarting from the converged solution on the same data stays put
+        # and is recognised as converged within a few iterations.
+        _, p_same = turnbull_em(left, right, max_iter=1, warm_start=(intervals, p_cold))
+        np.testing.assert_allclose(np.cumsum(p_same), np.cumsum(p_cold), atol=1e-3)
+        for acc in [None, 'squarem']:
+            solution = turnbull_em(left, right, tol=1e-9, max_iter=20000, accelerator=acc)
+            _, _, diag = turnbull_em(left, right, tol=1e-9, max_iter=20000, accelerator=acc,
+                                     warm_start=solution, return_diagnostics=True)
+            self.assertTrue(diag['converged'])
+            self.assertLessEqual(diag['iterations'], 3)
+
+    def test_turnbull_curve(self):
+        rng = np.random.default_rng(6)
+        left = rng.integers(0, 20, 200).astype(float)
+        right = left + rng.integers(0, 5, 200)
+        right[:20] = np.inf
+
+        curve = turnbull_em(left, right, return_curve=True)
+        self.assertIsInstance(curve, TurnbullCurve)
+        intervals, probs = turnbull_em(left, right)
+        np.testing.assert_array_equal(curve.intervals, intervals)
+        np.testing.assert_array_equal(curve.probs, probs)
+
+        # Brute-force S(t) with the same conventions as predict_turnbull.
+        times = np.linspace(-1, 25, 105)
+        starts, ends = intervals[:, 0], intervals[:, 1]
+        single = (starts == ends)
+        mask = (single[None, :] & (starts[None, :] > times[:, None])) | \
+               (~single[None, :] & (starts[None, :] >= times[:, None]))
+        expected = mask.astype(float) @ probs
+
+        np.testing.assert_allclose(curve.sf(times), expected, atol=1e-12)
+        np.testing.assert_allclose(curve.cdf(times) + curve.sf(times), 1.0)
+
+        # Quantiles of point masses invert the CDF exactly.
+        points = TurnbullCurve(np.array([[1, 1], [3, 3], [5, 5]]), np.array([0.2, 0.5, 0.3]))
+        np.testing.assert_array_equal(points.quantile([0.0, 0.1, 0.2, 0.21, 0.7, 0.71, 1.0]),
+                                      [1, 1, 1, 3, 3, 5, 5])
+
+        # Mass on an open interval (2, 4) is reached just above its start.
+        mixed = TurnbullCurve(np.array([[1, 1], [2, 4]]), np.array([0.4, 0.6]))
+        np.testing.assert_array_equal(mixed.quantile([0.3, 0.5]), [1, 2])
+        np.testing.assert_allclose(mixed.cdf([2.0, 2.5]), [0.4, 1.0])
+
+    def test_coarsened_npmle(self):
+        rng = np.random.default_rng(7)
+        x = rng.lognormal(1, 0.5, 2000)
+        left = np.maximum(x - rng.uniform(0, 1, 2000), 0.01)
+        right = left + rng.uniform(0.5, 2, 2000)
+        right[:100] = np.inf
+
+        # Endpoints only move outward, by at most the reported bound.
+        for grid in ['quantile', 0.25, np.arange(0, 30, 0.5)]:
+            left_c, right_c, shift = coarsen_intervals(left, right, grid, n_bins=32)
+            self.assertTrue(np.all(left_c <= left))
+            self.assertTrue(np.all(right_c >= right))
+            finite = np.isfinite(right)
+            self.assertLessEqual(np.max(left - left_c), shift)
+            self.assertLessEqual(np.max(right_c[finite] - right[finite]), shift)
+            np.testing.assert_array_equal(right_c[~finite], np.inf)
+
+        curve = turnbull_em(left, right, coarsen=0.25, return_curve=True)
+        self.assertLessEqual(curve.coarsening_error, 0.25)
+        self.assertLess(len(curve.probs), 2 * 32 / 0.25)
+        exact = turnbull_em(left, right, return_curve=True)
+        self.assertEqual(exact.coarsening_error, 0.0)
+
+        # The approximate median is close to the exact one.
+        self.assertLess(abs(curve.quantile(0.5) - exact.quantile(0.5)), 0.5)
+
+        # Grid points are kept exactly.
+        left_c, right_c, shift = coarsen_intervals([1.0, 2.0], [1.0, 3.0], [0, 1, 2, 3])
+        np.testing.assert_array_equal(left_c, [1, 2])
+        np.testing.assert_array_equal(right_c, [1, 3])
+        self.assertEqual(shift, 0.0)
+
+        with self.assertRaises(ValueError):
+            coarsen_intervals(left, right, 'bogus')
+        with self.assertRaises(ValueError):
+            coarsen_intervals(left, right, -1.0)
+
+        res = impute(np.column_stack([left, right]), censoring_type='interval', method='ros',
+                     coarsen='quantile', n_bins=50, impute_type='mean')
+        imputed = res['imputed_value'].values
+        self.assertTrue(np.all(imputed >= left - 1e-9))
+        self.assertTrue(np.all(imputed[np.isfinite(right)] <= right[np.isfinite(right)] + 1e-9))
+
+    def test_diagnostics(self):
+        rng = np.random.default_rng(8)
+        left = rng.integers(0, 30, 300).astype(float)
+        right = left + rng.integers(0, 6, 300)
+        right[:30] = np.inf
+
+        for kwargs in [{}, {'accelerator': 'squarem'}, {'solver': 'em-icm'}, {'prune_tol': 1e-6}]:
+            intervals, probs, diag = turnbull_em(left, right, return_diagnostics=True, **kwargs)
+            ref_intervals, ref_probs = turnbull_em(left, right, **kwargs)
+            np.testing.assert_array_equal(probs, ref_probs)
+
+            self.assertTrue(diag['converged'])
+            self.assertGreater(diag['iterations'], 0)
+            self.assertEqual(diag['n_rows'], 300)
+            self.assertEqual(diag['n_unique'], len(np.unique(np.column_stack([left, right]), axis=0)))
+            self.assertEqual(diag['n_intervals'], len(probs))
+            self.assertEqual(diag['support_size'], np.sum(probs > 1e-9))
+            self.assertGreaterEqual(diag['time_intervals'], 0.0)
+            self.assertGreaterEqual(diag['time_em'], 0.0)
+
+            # EM-type solvers never lower the likelihood.
+            trace = np.array(diag['log_likelihood_trace'])
+            self.assertTrue(np.all(np.diff(trace) >= -1e-8))
+            self.assertAlmostEqual(trace[-1], diag['log_likelihood'])
+
+        # Hitting max_iter is reported.
+        _, _, diag = turnbull_em(left, right, max_iter=2, tol=1e-12, return_diagnostics=True)
+        self.assertFalse(diag['converged'])
+        self.assertEqual(diag['iterations'], 2)
+
+        curve, diag = turnbull_em(left, right, return_curve=True, return_diagnostics=True)
+        self.assertIsInstance(curve, TurnbullCurve)
+
+        # Surfaced through impute() for interval and mixed ROS.
+        res = impute(np.column_stack([left + 1, right + 1]), censoring_type='interval', method='ros')
+        self.assertTrue(res.attrs['turnbull_diagnostics']['converged'])
+        self.assertEqual(res.attrs['turnbull_diagnostics']['n_rows'], 300)
+
+        status = np.zeros(300, dtype=int)
+        status[:40] = -1
+        status[-40:] = 1
+        res = impute(left + 1, status, censoring_type='mixed', method='ros', dist='auto')
+        self.assertIn('turnbull_diagnostics', res.attrs)
+
+    def test_doubly_censored_kernel(self):
+        rng = np.random.default_rng(9)
+        n = 3000
+        x = np.round(rng.lognormal(1, 1, n), 2)
+        lod = rng.choice([0.5, 1.0, 2.0, 4.0], n)
+        status = np.where(x < lod, -1, np.where(x > 4 * lod, 1, 0))
+        left = np.where(status == -1, 0.0, np.where(status == 1, 4 * lod, x))
+        right = np.where(status == -1, lod, np.where(status == 1, np.inf, x))
+
+        left_u, right_u, counts, _ = collapse_intervals(left, right)
+        endpoints = np.unique(np.concatenate([left_u, right_u]))
+        _, first, last = _equivalence_intervals(left_u, right_u, endpoints[np.isfinite(endpoints)])
+        m = last.max() + 1
+        self.assertTrue(_is_doubly_censored(first, last, m))
+
+        p0 = np.ones(m) / m
+        trace = []
+        p_ref, it_ref, _ = _self_consistency(p0, first, last, counts, max_iter=5000, tol=1e-9)
+        p_fast, it_fast, converged = _doubly_censored_em(p0, first, last, counts, max_iter=5000, tol=1e-9, trace=trace)
+        self.assertTrue(converged)
+        self.assertEqual(it_fast, it_ref)
+        np.testing.assert_allclose(p_fast, p_ref, atol=1e-12)
+        np.testing.assert_allclose(trace[-1], _log_likelihood(p_fast, first, last, counts), rtol=1e-6)
+        self.assertTrue(np.all(np.diff(trace) >= -1e-8))
+
+        # General interval rows use the general kernel.
+        self.assertFalse(_is_doubly_censored(np.array([0, 1]), np.array([1, 2]), 4))
+
     def test_predict_turnbull(self):
         # Setup: Intervals [1, 1] (prob 0.5) and [3, 3] (prob 0.5).
         intervals = np.array([[1, 1], [3, 3]])